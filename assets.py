@@ -0,0 +1,161 @@
+"""
+Asset helpers shared by build.py and the Flask app (portfolio.py).
+Keep this module free of Flask imports so the static build stays light.
+"""
+import gzip, hashlib, os, re, threading, zlib
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+# ─── Compression ────────────────────────────────────────────
+# Preference order when a client accepts several encodings equally.
+ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+def compress(data, encoding):
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"unsupported encoding: {encoding}")
+
+def streaming_compressor(encoding):
+    """Return (feed, finish) for compressing a response as it is produced.
+    feed() flushes after every chunk so each one reaches the client at once."""
+    if encoding == "gzip":
+        z = zlib.compressobj(6, zlib.DEFLATED, 31)
+        return (lambda data: z.compress(data) + z.flush(zlib.Z_SYNC_FLUSH)), z.flush
+    if encoding == "br" and brotli is not None:
+        c = brotli.Compressor(quality=5)
+        return (lambda data: c.process(data) + c.flush()), c.finish
+    raise ValueError(f"unsupported encoding: {encoding}")
+
+def write_compressed_variants(path, data):
+    """Write <path>.gz (and <path>.br when brotli is installed) next to path.
+    Returns {encoding: compressed size}."""
+    sizes = {}
+    for encoding in ENCODINGS:
+        packed = compress(data, encoding)
+        with open(path + SUFFIXES[encoding], "wb") as f:
+            f.write(packed)
+        sizes[encoding] = len(packed)
+    return sizes
+
+def size_report(label, raw_size, sizes):
+    parts = [f"{label} {raw_size:,} B"]
+    for encoding, size in sizes.items():
+        parts.append(f"{encoding} {size:,} B ({size / raw_size:.1%})" if raw_size else f"{encoding} {size:,} B")
+    return "  ".join(parts)
+
+def clean_stale_variants(path):
+    for encoding, suffix in SUFFIXES.items():
+        if encoding not in ENCODINGS and os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+# ─── Static file fingerprinting ─────────────────────────────
+# "static/me.png" becomes "static/me.<sha256[:10]>.png" so the URL changes
+# whenever the bytes do and browsers can cache it forever.
+FINGERPRINT_LEN = 10
+COMPRESSIBLE = (".css", ".js", ".json", ".svg", ".txt", ".html", ".xml")
+_digests = {}  # path -> (mtime_ns, size, digest)
+_digests_lock = threading.Lock()
+
+def file_digest(path):
+    st = os.stat(path)
+    cached = _digests.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    digest = h.hexdigest()[:FINGERPRINT_LEN]
+    with _digests_lock:
+        _digests[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+def fingerprint_name(name, digest):
+    root, ext = os.path.splitext(name)
+    return f"{root}.{digest}{ext}"
+
+def split_fingerprint(name):
+    """'img/me.0123abcdef.png' -> ('img/me.png', '0123abcdef'); (name, None) if unhashed."""
+    root, ext = os.path.splitext(name)
+    base, dot, digest = root.rpartition(".")
+    if dot and len(digest) == FINGERPRINT_LEN and all(c in "0123456789abcdef" for c in digest):
+        return base + ext, digest
+    return name, None
+
+def static_relpath(url, static_dir):
+    """Map a config reference like 'static/me.png' or '/static/me.png' to a
+    path relative to static_dir, or None if it is not a local static file."""
+    if not url or "://" in url:
+        return None
+    rel = url.lstrip("/")
+    if not rel.startswith("static/"):
+        return None
+    rel = os.path.normpath(rel[len("static/"):]).replace(os.sep, "/")
+    if rel.startswith("..") or os.path.isabs(rel):
+        return None
+    return rel if os.path.isfile(os.path.join(static_dir, rel)) else None
+
+def static_url(url, static_dir, prefix="/static/"):
+    rel = static_relpath(url, static_dir)
+    if rel is None:
+        return url
+    return prefix + fingerprint_name(rel, file_digest(os.path.join(static_dir, rel)))
+
+# ─── Critical CSS + long-cacheable CSS / JS ─────────────────
+# The page's <style> is split on its "/* ════ NAME ════ */" banners: sections
+# needed for the first screen (navbar, hero, ...) stay inline, everything
+# else moves to a content-hashed .css loaded without blocking render. Inline
+# <script> blocks become content-hashed, deferred .js files.
+CRITICAL_CSS = ("CSS VARIABLES", "RESET & BASE", "ANIMATED BACKGROUND", "CURSOR FOLLOWER",
+                "NAVBAR", "HERO", "SECTIONS", "RESPONSIVE", "ANIMATIONS", "TYPING ANIMATION")
+# Media-query overrides must come after the rules they override, so they
+# are inlined for the first screen and repeated at the end of the stylesheet
+REPEATED_CSS = ("RESPONSIVE",)
+_CSS_BANNER = re.compile(r"(/\* ═+ (.+?) ═+ \*/)")
+_STYLE = re.compile(r"<style>(.*?)</style>", re.S)
+_INLINE_SCRIPT = re.compile(r"<script>(.*?)</script>", re.S)
+
+def hashed_name(stem, data, ext):
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:FINGERPRINT_LEN]}{ext}"
+
+def split_critical_css(css):
+    parts = _CSS_BANNER.split(css)  # [preamble, banner, name, body, banner, name, body, ...]
+    critical, deferred = [parts[0]], []
+    for banner, name, body in zip(parts[1::3], parts[2::3], parts[3::3]):
+        key = name.split(" (")[0].strip()
+        if key in CRITICAL_CSS:
+            critical.append(banner + body)
+        if key not in CRITICAL_CSS or key in REPEATED_CSS:
+            deferred.append(banner + body)
+    return "".join(critical), "".join(deferred)
+
+def externalize_assets(html, prefix):
+    """Move non-critical CSS and inline JS out of html (a whole page or a
+    streamed chunk of one). Returns (html, {file name: bytes})."""
+    files = {}
+    m = _STYLE.search(html)
+    if m:
+        critical, deferred = split_critical_css(m.group(1))
+        data = deferred.encode("utf-8")
+        href = prefix + hashed_name("portfolio", data, ".css")
+        files[href[len(prefix):]] = data
+        html = (html[:m.start()] + f"<style>{critical}</style>\n"
+                f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+                f'    <noscript><link rel="stylesheet" href="{href}"></noscript>' + html[m.end():])
+    for m in reversed(list(_INLINE_SCRIPT.finditer(html))):
+        data = m.group(1).encode("utf-8")
+        name = hashed_name("portfolio", data, ".js")
+        files[name] = data
+        html = html[:m.start()] + f'<script src="{prefix}{name}" defer></script>' + html[m.end():]
+    return html, files
+
+def breakdown_report(before, after, files):
+    lines = [f"HTML {before:,} B -> {after:,} B ({after / before:.0%})" if before else f"HTML {after:,} B"]
+    lines += [f"  + {name} {len(data):,} B (cacheable)" for name, data in sorted(files.items())]
+    return "\n".join(lines)
@@ -0,0 +1,458 @@
+"""
+Benchmark suite — measures the Flask app and the static build across config
+sizes, from the real config.json up to synthetic portfolios with thousands of
+projects, skills and experience entries.
+
+Usage:  python bench.py [run] [--sizes base,medium,large] [--quick] [-o FILE]
+        python bench.py generate --projects 3000 --skills 1000 --experience 500 -o big.json
+        python bench.py compare OLD.json NEW.json [--threshold 10]
+        python bench.py coldstart [--runs 5]
+
+For each size the repository is copied to a scratch directory (your
+config.json, docs/ and .build-cache/ are never touched), the synthetic
+config is written there, and:
+  client  portfolio.index() through the Flask test client: cold renders
+          (page + section caches cleared before every request), cached
+          hits, /api/config full bodies and 304 revalidations; latency
+          percentiles, requests/sec, import time and peak RSS
+  http    portfolio.py --prod on a local port, driven by N keep-alive
+          client threads for a fixed time: requests/sec, latency percentiles
+          and errors for / (gzip) and /api/config
+  build   build.py wall time and peak RSS for a cold build, a no-op rebuild
+          and a rebuild after a one-section edit, plus output sizes
+
+Results go to bench-results/<timestamp>.json (or -o). "compare" lists every
+metric present in both files and flags changes for the worse beyond the
+threshold, so runs can be checked for regressions. Timings depend on the
+machine and its load; compare runs from the same machine.
+
+"coldstart" checks build.py's start-up against COLD_START_BUDGET: the time
+to import it (python -X importtime) and the wall time of fresh build.py
+processes, best of --runs. It fails if a budget is exceeded or if build.py
+pulls in Flask.
+"""
+import argparse, copy, http.client, json, os, platform, random, shutil, signal, socket
+import subprocess, sys, io, tempfile, threading, time
+import vitals
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, "config.json")
+RESULTS_DIR = os.path.join(BASE_DIR, "bench-results")
+RESULTS_VERSION = 1
+# (projects, skill items, experience entries); "base" is config.json as it is
+SIZES = {"base": None, "medium": (300, 200, 100), "large": (2000, 1000, 500), "xlarge": (5000, 3000, 1500)}
+DEFAULT_SIZES = "base,medium,large"
+GZIP = {"Accept-Encoding": "gzip"}
+# Not copied to the scratch directory
+SKIP = shutil.ignore_patterns(".git", "docs", ".build-cache", "__pycache__", "bench-results", "variants",
+                              "profiles", "vitals.sqlite3*")
+
+# ─── Synthetic configs ──────────────────────────────────────
+def synthetic_config(base, projects=0, skills=0, experience=0, seed=1):
+    """config.json scaled up: base's meta, theme, personal data and so on,
+    with projects / skill items / experience entries generated from base's
+    own entries (shuffled text, so the page compresses like a real one).
+    A count of 0 keeps base's list as it is."""
+    rng = random.Random(seed)
+    cfg = copy.deepcopy(base)
+
+    def shuffled(text):
+        words = text.split()
+        rng.shuffle(words)
+        return " ".join(words)
+
+    if skills:
+        per_category = 12
+        cfg["skills"] = [{"category": f"Skill Group {c + 1}", "icon": base["skills"][c % len(base["skills"])]["icon"],
+                          "items": [{"name": f"Skill {i + 1}", "level": rng.randint(40, 100)}
+                                    for i in range(c * per_category, min(skills, (c + 1) * per_category))]}
+                         for c in range((skills + per_category - 1) // per_category)]
+    tech = [item["name"] for group in cfg["skills"] for item in group["items"]]
+    if projects:
+        categories = [f"Category {c + 1}" for c in range(min(24, max(1, projects // 40)))]
+        cfg["projects"] = []
+        for i in range(projects):
+            p = copy.deepcopy(base["projects"][i % len(base["projects"])])
+            p.update(title=f"{p['title']} #{i + 1}", description=shuffled(p["description"]),
+                     tech=rng.sample(tech, min(len(tech), rng.randint(3, 8))),
+                     featured=i < 3, category=categories[i % len(categories)])
+            cfg["projects"].append(p)
+    if experience:
+        cfg["experience"] = []
+        for i in range(experience):
+            e = copy.deepcopy(base["experience"][i % len(base["experience"])])
+            year = 2025 - i // 2
+            e.update(company=f"{e['company']} {i + 1}", duration=f"Jan {year} – Dec {year}",
+                     description=[shuffled(line) for line in e["description"]],
+                     tech=rng.sample(tech, min(len(tech), rng.randint(3, 6))))
+            cfg["experience"].append(e)
+    return cfg
+
+def config_for(size, base):
+    counts = SIZES[size]
+    return copy.deepcopy(base) if counts is None else synthetic_config(base, *counts)
+
+def describe(cfg):
+    return {"projects": len(cfg.get("projects", [])),
+            "skills": sum(len(s["items"]) for s in cfg.get("skills", [])),
+            "experience": len(cfg.get("experience", [])),
+            "bytes": len(json.dumps(cfg, indent=4, ensure_ascii=False).encode("utf-8"))}
+
+# ─── Helpers ────────────────────────────────────────────────
+def percentiles(samples_ms):
+    s = sorted(samples_ms)
+    if not s:
+        return {"n": 0}
+    pick = lambda q: vitals.percentile(s, q)  # nearest rank, as the Web Vitals report
+    return {"n": len(s), "mean_ms": round(sum(s) / len(s), 3), "p50_ms": round(pick(0.50), 3),
+            "p90_ms": round(pick(0.90), 3), "p99_ms": round(pick(0.99), 3), "max_ms": round(s[-1], 3)}
+
+def run_child(cmd, cwd, env=None):
+    # Returns (stdout, wall seconds, peak RSS in MB); wait4() gives this
+    # child's own rusage, not the sum over everything we have run
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    out = proc.stdout.read()
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    wall = time.perf_counter() - t0
+    if proc.returncode:
+        raise RuntimeError(f"{' '.join(cmd)} exited with {proc.returncode}:\n{out.decode('utf-8', 'replace')}")
+    return out.decode("utf-8", "replace"), wall, usage.ru_maxrss / 1024
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+# ─── Flask test client (runs in a child process) ────────────
+def client_bench(iterations):
+    t0 = time.perf_counter()
+    import portfolio
+    import_ms = (time.perf_counter() - t0) * 1000
+    client = portfolio.app.test_client()
+
+    def timed(path, headers=None, before=None, status=200):
+        samples = []
+        for _ in range(iterations):
+            if before:
+                before()
+            t = time.perf_counter()
+            resp = client.get(path, headers=headers)
+            resp.get_data()
+            samples.append((time.perf_counter() - t) * 1000)
+            if resp.status_code != status:
+                raise RuntimeError(f"GET {path}: {resp.status_code}")
+        result = percentiles(samples)
+        result["rps"] = round(len(samples) / (sum(samples) / 1000), 1)
+        return result
+
+    def clear_caches():
+        portfolio._page_cache.clear()
+        portfolio._fragments.entries.clear()
+
+    t0 = time.perf_counter()
+    first = client.get("/", headers=GZIP)
+    first_ms = (time.perf_counter() - t0) * 1000
+    etag = client.get("/api/config").headers["ETag"]
+    return {"import_ms": round(import_ms, 1), "first_request_ms": round(first_ms, 1),
+            "page_bytes": len(portfolio.get_page().body), "page_gzip_bytes": len(first.get_data()),
+            "index_cold": timed("/", GZIP, clear_caches),
+            "index_cached": timed("/", GZIP),
+            "api_config": timed("/api/config"),
+            "api_config_304": timed("/api/config", {"If-None-Match": etag}, status=304)}
+
+def run_client(workdir, iterations):
+    out, _, rss = run_child([sys.executable, os.path.join(workdir, "bench.py"), "_client",
+                             "--iterations", str(iterations)], workdir)
+    result = json.loads(out.strip().splitlines()[-1])
+    result["peak_rss_mb"] = round(rss, 1)
+    return result
+
+# ─── HTTP load driver ───────────────────────────────────────
+def drive(port, path, headers, concurrency, duration):
+    """concurrency threads, each on its own keep-alive connection (reopened
+    when the server closes it), send GET path until duration runs out."""
+    samples, errors, lock = [], [0], threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        conn, local, failed = None, [], 0
+        while time.perf_counter() < deadline:
+            if conn is None:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+            t = time.perf_counter()
+            try:
+                conn.request("GET", path, headers=headers or {})
+                resp = conn.getresponse()
+                resp.read()
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                conn.close()
+                conn = None
+                continue
+            local.append((time.perf_counter() - t) * 1000)
+            if resp.status >= 400:
+                failed += 1
+            if resp.will_close:
+                conn.close()
+                conn = None
+        if conn is not None:
+            conn.close()
+        with lock:
+            samples.extend(local)
+            errors[0] += failed
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    result = percentiles(samples)
+    result.update(rps=round(len(samples) / (time.perf_counter() - t0), 1), errors=errors[0])
+    return result
+
+def run_http(workdir, workers, threads, concurrency, duration):
+    port = free_port()
+    env = dict(os.environ, PORTFOLIO_LIVE_RELOAD="0")
+    proc = subprocess.Popen([sys.executable, "portfolio.py", "--prod", "--host", "127.0.0.1",
+                             "--port", str(port), "--workers", str(workers), "--threads", str(threads)],
+                            cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.time() + 60
+        while True:
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+                conn.request("GET", "/")
+                if conn.getresponse().status == 200:
+                    conn.close()
+                    break
+            except OSError:
+                pass
+            if proc.poll() is not None or time.time() > deadline:
+                raise RuntimeError("portfolio.py --prod did not come up")
+            time.sleep(0.1)
+        return {"workers": workers, "threads": threads, "concurrency": concurrency,
+                "index": drive(port, "/", GZIP, concurrency, duration),
+                "api_config": drive(port, "/api/config", None, concurrency, duration)}
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+# ─── Static build ───────────────────────────────────────────
+def output_sizes(docs):
+    sizes = {"html_bytes": 0, "html_gzip_bytes": 0, "assets_bytes": 0, "files": 0}
+    for root, _, files in os.walk(docs):
+        for name in files:
+            size = os.path.getsize(os.path.join(root, name))
+            sizes["files"] += 1
+            if name == "index.html":
+                sizes["html_bytes"] += size
+            elif name == "index.html.gz":
+                sizes["html_gzip_bytes"] += size
+            elif os.path.basename(root) == "assets" and not name.endswith((".gz", ".br")):
+                sizes["assets_bytes"] += size
+    return sizes
+
+def run_build(workdir, cfg):
+    for d in ("docs", ".build-cache"):
+        shutil.rmtree(os.path.join(workdir, d), ignore_errors=True)
+    cmd = [sys.executable, "build.py", "--jobs", "1"]
+    result = {}
+    for step in ("cold", "noop", "one_section"):
+        if step == "one_section":
+            edited = copy.deepcopy(cfg)
+            edited["footer"]["tagline"] += " (edited)"
+            write_config(os.path.join(workdir, "config.json"), edited)
+        _, wall, rss = run_child(cmd, workdir)
+        result[step] = {"wall_ms": round(wall * 1000, 1), "peak_rss_mb": round(rss, 1)}
+    result["output"] = output_sizes(os.path.join(workdir, "docs"))
+    return result
+
+# ─── Cold start ─────────────────────────────────────────────
+# Milliseconds, with headroom over a 1-CPU machine: importing build.py, a
+# no-op build, a --force build with the Jinja bytecode cache warm, and a
+# first build with no .build-cache/ at all (template compiled from scratch)
+COLD_START_BUDGET = {"import_ms": 60, "noop_ms": 160, "rebuild_ms": 350, "first_build_ms": 450}
+FORBIDDEN_IMPORTS = ("flask", "werkzeug")
+
+def import_times(workdir):
+    # {module: cumulative ms} for every import made by "import build"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import build"], cwd=workdir,
+                          capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = times.get(name.strip(), 0) + int(cumulative) / 1000
+    return times
+
+def cold_start(args):
+    workdir = tempfile.mkdtemp(prefix="portfolio-coldstart-")
+    try:
+        shutil.copytree(BASE_DIR, workdir, ignore=SKIP, dirs_exist_ok=True)
+        # Start from compiled .pyc files, as every run after the first does
+        # (unless PYTHONDONTWRITEBYTECODE is set)
+        subprocess.run([sys.executable, "-m", "compileall", "-q", workdir], check=True)
+        best = lambda values: round(min(values), 1)
+        runs = [import_times(workdir) for _ in range(args.runs)]
+        result = {"import_ms": best(r["build"] for r in runs)}
+        loaded = sorted(name for name in runs[0] if name.split(".")[0] in FORBIDDEN_IMPORTS)
+        cmd = [sys.executable, "build.py", "--jobs", "1"]
+        first, rebuild, noop = [], [], []
+        for _ in range(args.runs):
+            for d in ("docs", ".build-cache"):
+                shutil.rmtree(os.path.join(workdir, d), ignore_errors=True)
+            first.append(run_child(cmd, workdir)[1] * 1000)
+            rebuild.append(run_child(cmd + ["--force"], workdir)[1] * 1000)
+            noop.append(run_child(cmd, workdir)[1] * 1000)
+        result.update(noop_ms=best(noop), rebuild_ms=best(rebuild), first_build_ms=best(first))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    slowest = sorted(((ms, name) for name, ms in runs[0].items() if name != "build"), reverse=True)[:5]
+    print("     slowest imports: " + ", ".join(f"{name} {ms:.0f} ms" for ms, name in slowest))
+    over = 0
+    for key, budget in COLD_START_BUDGET.items():
+        flag = "  <-- over budget" if result[key] > budget else ""
+        over += bool(flag)
+        print(f"     {key:<16}{result[key]:>8.1f} ms  (budget {budget} ms){flag}")
+    if loaded:
+        over += 1
+        print(f"[!!] build.py imports {', '.join(loaded)}")
+    print(f"[{'!!' if over else 'OK'}] cold start " + ("over budget" if over else "within budget")
+          + f" (best of {args.runs} runs)")
+    return 1 if over else 0
+
+# ─── Runner ─────────────────────────────────────────────────
+def write_config(path, cfg):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cfg, f, indent=4, ensure_ascii=False)
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(args):
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        sys.exit(f"[ERROR] unknown size(s) {', '.join(unknown)}; choose from {', '.join(SIZES)}")
+    iterations, duration = (10, 2.0) if args.quick else (args.iterations, args.duration)
+    results = {"version": RESULTS_VERSION, "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+               "commit": git_commit(), "python": platform.python_version(), "platform": platform.platform(),
+               "cpus": os.cpu_count(), "iterations": iterations, "duration_s": duration, "sizes": {}}
+    workdir = tempfile.mkdtemp(prefix="portfolio-bench-")
+    try:
+        shutil.copytree(BASE_DIR, workdir, ignore=SKIP, dirs_exist_ok=True)
+        for size in sizes:
+            cfg = config_for(size, base)
+            write_config(os.path.join(workdir, "config.json"), cfg)
+            entry = results["sizes"][size] = {"config": describe(cfg)}
+            print(f"[..] {size}: {entry['config']['projects']} projects, {entry['config']['skills']} skills, "
+                  f"{entry['config']['experience']} experience entries")
+            entry["client"] = c = run_client(workdir, iterations)
+            print(f"     client  / cold p50 {c['index_cold']['p50_ms']} ms, cached {c['index_cached']['rps']} req/s, "
+                  f"/api/config {c['api_config']['rps']} req/s, peak {c['peak_rss_mb']} MB")
+            if not args.no_http:
+                entry["http"] = h = run_http(workdir, args.workers, args.threads, args.concurrency, duration)
+                print(f"     http    / {h['index']['rps']} req/s (p99 {h['index'].get('p99_ms')} ms), "
+                      f"/api/config {h['api_config']['rps']} req/s, "
+                      f"{h['index']['errors'] + h['api_config']['errors']} errors")
+            if not args.no_build:
+                entry["build"] = b = run_build(workdir, cfg)
+                print(f"     build   cold {b['cold']['wall_ms']} ms, no-op {b['noop']['wall_ms']} ms, "
+                      f"one section {b['one_section']['wall_ms']} ms, peak {b['cold']['peak_rss_mb']} MB, "
+                      f"html {b['output']['html_bytes']:,} B")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    path = args.output or os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"[OK] results written to {os.path.relpath(path)}")
+
+# ─── Comparing runs ─────────────────────────────────────────
+def flatten(data, prefix=""):
+    for key, value in data.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield prefix + key, value
+
+def compare(args):
+    with open(args.old, "r", encoding="utf-8") as f:
+        old = dict(flatten(json.load(f).get("sizes", {})))
+    with open(args.new, "r", encoding="utf-8") as f:
+        new = dict(flatten(json.load(f).get("sizes", {})))
+    regressions = 0
+    for key in sorted(old.keys() & new.keys()):
+        if key.endswith((".n", ".errors", "iterations", "concurrency", "workers", "threads")) or ".config." in key:
+            continue
+        a, b = old[key], new[key]
+        change = (b - a) / a * 100 if a else 0.0
+        # Only throughput is better when higher; sizes, times and memory are better lower
+        worse = -change if key.endswith("rps") else change
+        flag = "  <-- regression" if worse > args.threshold else ""
+        regressions += bool(flag)
+        print(f"{key:<48} {a:>12,.1f} -> {b:>12,.1f}  {change:+6.1f}%{flag}")
+    print(f"[{'!!' if regressions else 'OK'}] {regressions} metric(s) worse by more than {args.threshold:g}%")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace", line_buffering=True)
+    parser = argparse.ArgumentParser(description="Benchmark the portfolio app and static build")
+    sub = parser.add_subparsers(dest="command")
+    p = sub.add_parser("run", help="run the benchmarks (default)")
+    for target in (parser, p):
+        target.add_argument("--sizes", default=DEFAULT_SIZES, help=f"comma-separated, from: {', '.join(SIZES)}")
+        target.add_argument("--iterations", type=int, default=50, help="test-client requests per measurement")
+        target.add_argument("--duration", type=float, default=5.0, help="seconds per HTTP load measurement")
+        target.add_argument("--concurrency", type=int, default=8, help="HTTP client threads")
+        target.add_argument("--workers", type=int, default=2, help="server worker processes")
+        target.add_argument("--threads", type=int, default=8, help="threads per server worker")
+        target.add_argument("--quick", action="store_true", help="10 iterations, 2 s load runs")
+        target.add_argument("--no-http", action="store_true", help="skip the HTTP load runs")
+        target.add_argument("--no-build", action="store_true", help="skip the build.py runs")
+        target.add_argument("-o", "--output", help="results file (default: bench-results/<timestamp>.json)")
+    g = sub.add_parser("generate", help="write a synthetic config")
+    g.add_argument("--projects", type=int, default=1000)
+    g.add_argument("--skills", type=int, default=500)
+    g.add_argument("--experience", type=int, default=200)
+    g.add_argument("--seed", type=int, default=1)
+    g.add_argument("-o", "--output", required=True, help="where to write the config")
+    c = sub.add_parser("compare", help="compare two results files")
+    c.add_argument("old")
+    c.add_argument("new")
+    c.add_argument("--threshold", type=float, default=10.0, help="percent change counted as a regression")
+    s = sub.add_parser("coldstart", help="check build.py's start-up time against its budget")
+    s.add_argument("--runs", type=int, default=5, help="runs per measurement; the best one counts")
+    i = sub.add_parser("_client")  # internal: the test-client measurements, in a fresh process
+    i.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            cfg = synthetic_config(json.load(f), args.projects, args.skills, args.experience, args.seed)
+        write_config(args.output, cfg)
+        print(f"[OK] {args.output}: " + ", ".join(f"{k} {v:,}" for k, v in describe(cfg).items()))
+    elif args.command == "compare":
+        sys.exit(compare(args))
+    elif args.command == "coldstart":
+        sys.exit(cold_start(args))
+    elif args.command == "_client":
+        sys.path.insert(0, BASE_DIR)
+        print(json.dumps(client_bench(args.iterations)))
+    else:
+        run(args)
@@ -1,48 +1,508 @@
 """
-Build script — Renders the Flask/Jinja2 template into a static index.html
-for deployment on GitHub Pages (or any static host).
+Build script — Renders templates/index.html into a static index.html
+for deployment on GitHub Pages (or any static host), without Flask.
 
-Usage:  python build.py
-Output: docs/index.html  (GitHub Pages can serve from /docs)
+Usage:  python build.py [--force] [--variant NAME ...] [--jobs N] [--no-minify] [--profile]
+Output: docs/index.html  (GitHub Pages can serve from /docs; Font Awesome
+        icons inlined as an SVG sprite, see icons.py)
+        docs/assets/portfolio.<hash>.css / .js  (non-critical CSS + page script)
+        docs/static/<image>.<hash>-<width>.avif / .webp / .jpg  (see images.py)
+        docs/api/projects/<category>/<page>.json  (static /api/projects, see projects.py)
+        plus precompressed .gz (and .br when brotli is installed) siblings
+
+Variants: every variants/<name>.json is an overlay deep-merged onto
+config.json (objects merge key by key, anything else is replaced) and is
+published to docs/<name>/index.html — e.g. variants/de.json with translated
+text and "meta": {"lang": "de"}, or variants/light.json with a "theme".
+All variants render in parallel in a process pool sharing one compiled
+template. --variant limits the build to the named ones ("default" is the
+plain config.json build).
+
+Builds are incremental: docs/.build-manifest.json records the hashes of every
+input (config, template, static files, the build pipeline itself) and every
+output; .build-cache/ keeps local mtime/size data so unchanged files are not
+re-hashed. When no input changed the build is skipped, and an output file is
+only rewritten when its bytes actually differ, so its mtime (and the deploy)
+only changes when the content does. Rendered page sections are cached in
+.build-cache/fragments.json keyed on the config they read (fragments.py), so
+a rebuild after a one-section edit renders only that section. --force
+rebuilds regardless, without the section cache.
+
+HTML, CSS and JS are minified (see minify.py) before they are hashed and
+compressed; the size report shows raw -> minified -> gzip/br per artifact.
+--no-minify writes them as rendered, e.g. to debug the page source.
 """
-import json, os, sys, io
+import argparse, hashlib, json, os, sys, io, time
+from collections import namedtuple, OrderedDict
 
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
 
-from jinja2 import Environment
+import assets, fragments, icons, images, minify, page_template, projects
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(BASE_DIR, "config.json")
 OUTPUT_DIR = os.path.join(BASE_DIR, "docs")
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+VARIANTS_DIR = os.path.join(BASE_DIR, "variants")
+DEFAULT_VARIANT = "default"
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, ".build-manifest.json")
+CACHE_DIR = os.path.join(BASE_DIR, ".build-cache")
+STATS_PATH = os.path.join(CACHE_DIR, "stats.json")
+IMAGE_CACHE_DIR = os.path.join(CACHE_DIR, "images")
+IMAGE_INDEX_PATH = os.path.join(IMAGE_CACHE_DIR, "index.json")
+FRAGMENTS_PATH = os.path.join(CACHE_DIR, "fragments.json")
+FRAGMENT_CACHE_LIMIT = 256  # rendered sections kept across builds (all variants)
+MANIFEST_VERSION = 2
+# A change to any of these can change every output
+PIPELINE_FILES = ("build.py", "assets.py", "config_model.py", "fragments.py", "icons.py", "images.py", "minify.py",
+                  "page_template.py", "projects.py", "vendor/fontawesome/icons.json")
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+# ─── Inputs ─────────────────────────────────────────────────
+def hash_file(rel, old_stats, stats):
+    # Reuse the recorded hash while mtime and size are unchanged
+    st = os.stat(os.path.join(BASE_DIR, rel))
+    cached = old_stats.get(rel)
+    if cached and cached[:2] == [st.st_mtime_ns, st.st_size]:
+        digest = cached[2]
+    else:
+        with open(os.path.join(BASE_DIR, rel), "rb") as f:
+            digest = sha256(f.read())
+    stats[rel] = [st.st_mtime_ns, st.st_size, digest]
+    return digest
+
+def collect_inputs(old_stats):
+    stats = {}
+    inputs = {"template": page_template.source().digest}
+    for rel in ("config.json",) + PIPELINE_FILES:
+        inputs[rel] = hash_file(rel, old_stats, stats)
+    for root, dirs, files in os.walk(STATIC_DIR):
+        dirs.sort()
+        for name in sorted(files):
+            rel = os.path.relpath(os.path.join(root, name), BASE_DIR).replace(os.sep, "/")
+            inputs[rel] = hash_file(rel, old_stats, stats)
+    return inputs, stats
+
+def discover_variants():
+    if not os.path.isdir(VARIANTS_DIR):
+        return []
+    return sorted(name[:-5] for name in os.listdir(VARIANTS_DIR)
+                  if name.endswith(".json") and name[:-5] != DEFAULT_VARIANT)
+
+def variant_inputs(name, shared, old_stats, stats):
+    inputs = dict(shared)
+    if name != DEFAULT_VARIANT:
+        rel = f"variants/{name}.json"
+        inputs[rel] = hash_file(rel, old_stats, stats)
+    return inputs
+
+def deep_merge(base, overlay):
+    merged = dict(base)
+    for key, value in overlay.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def load_variant_config(base_cfg, name):
+    if name == DEFAULT_VARIANT:
+        return base_cfg
+    with open(os.path.join(VARIANTS_DIR, name + ".json"), "r", encoding="utf-8") as f:
+        return deep_merge(base_cfg, json.load(f))
+
+def variant_dir(name):
+    # Path of a variant's pages relative to docs/
+    return "" if name == DEFAULT_VARIANT else name + "/"
+
+def changed_inputs(old, new):
+    reasons = [f"{k} changed" for k in new if k in old and old[k] != new[k]]
+    reasons += [f"{k} added" for k in new if k not in old]
+    reasons += [f"{k} removed" for k in old if k not in new]
+    return reasons
+
+# ─── Images ─────────────────────────────────────────────────
+def prepare_images(configs, jobs=None):
+    """Resized / re-encoded variants of every raster image the configs
+    reference, encoding only images not already in .build-cache/images/.
+    Returns {static rel path: meta} (see images.process_image) and records
+    it in the image index the Flask app reads too."""
+    refs = {}
+    for cfg in configs:
+        for url in images.image_refs(cfg):
+            rel = assets.static_relpath(url, STATIC_DIR)
+            if rel and images.is_raster(rel):
+                refs[rel] = assets.file_digest(os.path.join(STATIC_DIR, rel))
+    if not refs:
+        return {}
+    if not images.pillow():
+        print(f"[..] Pillow not installed: {len(refs)} image(s) published as they are (pip install Pillow)")
+        return {}
+    t0 = time.perf_counter()
+    rels = sorted(refs)
+    srcs = [os.path.join(STATIC_DIR, rel) for rel in rels]
+    dirs = [os.path.join(IMAGE_CACHE_DIR, refs[rel]) for rel in rels]
+    stale = sum(images.cached_meta(d) is None for d in dirs)
+    if stale > 1 and jobs != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            metas = list(pool.map(images.process_image, srcs, dirs))
+    else:
+        metas = [images.process_image(src, d) for src, d in zip(srcs, dirs)]
+    print(f"[OK] {len(rels)} image(s): {stale} encoded, {len(rels) - stale} from cache "
+          f"({(time.perf_counter() - t0) * 1000:.0f} ms, {' / '.join(images.modern_formats() or ['no modern formats'])})")
+    index = {rel: dict(meta, digest=refs[rel], dir=d) for rel, meta, d in zip(rels, metas, dirs)}
+    images.write_index(IMAGE_INDEX_PATH, dict(images.load_index(IMAGE_INDEX_PATH), **index))
+    return index
+
+# ─── Manifest ───────────────────────────────────────────────
+def load_json(path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == MANIFEST_VERSION:
+            return data
+    except (OSError, ValueError):
+        pass
+    return default
+
+def dump_json(path, data):
+    write_if_changed(path, (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8"))
+
+def load_manifest():
+    return load_json(MANIFEST_PATH, {"version": MANIFEST_VERSION, "variants": {}})
+
+def save_manifest(manifest):
+    dump_json(MANIFEST_PATH, manifest)
+
+def missing_outputs(outputs):
+    return [name for name in outputs if not os.path.exists(os.path.join(OUTPUT_DIR, name))]
+
+# ─── Section fragment cache (see fragments.py) ──────────────
+def load_fragments():
+    data = load_json(FRAGMENTS_PATH, {})
+    return OrderedDict((key, (html, effects)) for key, html, effects in data.get("entries", []))
+
+def save_fragments(entries, results):
+    # Keeps the sections this build used (most recent last) plus older ones up to the limit
+    for r in results:
+        for key in r.fragments_used:
+            if key in entries:
+                entries.move_to_end(key)
+        entries.update(r.fragments_added)
+    while len(entries) > FRAGMENT_CACHE_LIMIT:
+        entries.popitem(last=False)
+    data = {"version": MANIFEST_VERSION, "entries": [[k, html, effects] for k, (html, effects) in entries.items()]}
+    write_if_changed(FRAGMENTS_PATH, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+# ─── Render ─────────────────────────────────────────────────
+# One compiled template per process: loaded in the parent before the pool
+# forks (so workers inherit it), or once per worker where fork is unavailable,
+# from the bytecode cache in .build-cache/jinja/ (see page_template.py).
+# Sections are rendered through the fragment cache loaded from .build-cache/.
+# Jinja itself is only imported once there is something to render.
+_template = _env = _fragments = None
+Rendered = namedtuple("Rendered", "name html static_refs image_refs files project_pages raw_size source_sizes "
+                                  "n_icons fragments_hit fragments_added fragments_used render_ms")
+
+def static_url(ctx, url):
+    # Static files referenced from config get content-hashed names
+    rel = assets.static_relpath(url, STATIC_DIR)
+    if rel is None:
+        return url
+    ctx["static_refs"].add(rel)
+    return assets.static_url(url, STATIC_DIR, prefix=ctx["static_prefix"])
+
+def responsive_image(ctx, url, alt, sizes):
+    rel = assets.static_relpath(url, STATIC_DIR)
+    meta = ctx["images"].get(rel)
+    if meta is None:
+        return images.picture_html(static_url(ctx, url), alt, sizes)
+    ctx["image_refs"].add(rel)
+    sources = {}  # format -> [(url, width)], in images.process_image order: modern formats first
+    for width, fmt, file_name in meta["variants"]:
+        url = ctx["static_prefix"] + images.variant_name(rel, meta["digest"], file_name)
+        sources.setdefault(fmt, []).append((url, width))
+    fallback = list(sources.values())[-1]
+    return images.picture_html(fallback[-1][0], alt, sizes, list(sources.items()), meta)
+
+def compile_template(fragment_entries=None):
+    global _template, _env, _fragments
+    if _template is None:
+        from jinja2 import Environment, pass_context
+        _env = Environment(autoescape=False)
+        _env.filters["static_url"] = pass_context(static_url)
+        _env.globals["responsive_image"] = pass_context(responsive_image)
+        _template = page_template.load(_env, "build")
+        _fragments = fragments.FragmentCache(FRAGMENT_CACHE_LIMIT, fragment_entries)
+    return _template
+
+def render(model, static_prefix="static/", image_index=None, salt="", variant=DEFAULT_VARIANT):
+    # Jinja-unfriendly values come precomputed with the config model
+    cfg = model.raw
+    static_refs, image_refs = set(), set()
+    context = dict(cfg=cfg, json_data=json.dumps(cfg),
+                   total_tech=model.total_tech,
+                   project_categories=model.project_categories,
+                   project_page_size=projects.PAGE_SIZE, project_image_sizes=projects.IMAGE_SIZES,
+                   projects_api="api/projects/",  # static pages, see project_pages()
+                   # A static host cannot take POSTs: beacons go to the collector
+                   # named in meta.vitals_url (a portfolio.py /api/vitals), if any
+                   vitals_url=cfg.get("meta", {}).get("vitals_url"), variant=variant,
+                   static_refs=static_refs, static_prefix=static_prefix,
+                   images=image_index or {}, image_refs=image_refs)
+    # static_prefix and the image index change the markup without being
+    # template variables, so they are part of the fragment salt
+    src = page_template.source()
+    pieces = fragments.generate(_template, context, _fragments, _env, src.text, src.digest, f"{salt}:{static_prefix}",
+                                effects=("static_refs", "image_refs"))
+    html = "".join(pieces)
+    return html, static_refs, image_refs, project_pages(cfg, model.project_index, context)
+
+def project_pages(cfg, project_index, context):
+    # The /api/projects pages as static JSON: {path: bytes}. Card images are
+    # referenced from the page, so their URLs use the page's static_prefix.
+    picture = lambda proj: responsive_image(context, proj["image"], proj["title"], projects.IMAGE_SIZES)
+    return {path: json.dumps(page, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            for path, page in projects.static_pages(cfg.get("projects", []), project_index, picture)}
+
+def minify_artifacts(html, files, prefix):
+    # Minified CSS / JS get new content hashes, so the page's references to
+    # them are rewritten before the page itself is minified.
+    # Returns (html, files, {artifact name: size before minification}).
+    minified, source_sizes = {}, {}
+    for name, data in files.items():
+        stem, ext = os.path.splitext(assets.split_fingerprint(name)[0])
+        minifier = minify.minify_css if ext == ".css" else minify.minify_js
+        small = minifier(data.decode("utf-8")).encode("utf-8")
+        new_name = assets.hashed_name(stem, small, ext)
+        html = html.replace(prefix + name, prefix + new_name)
+        minified[new_name] = small
+        source_sizes[new_name] = len(data)
+    source_sizes["index.html"] = len(html.encode("utf-8"))
+    return minify.minify_html(html), minified, source_sizes
+
+def render_variant(name, model, minified=True, image_index=None, salt=""):
+    t0 = time.perf_counter()
+    hits, added = _fragments.hits, len(_fragments.added)
+    up = "../" * variant_dir(name).count("/")
+    html, static_refs, image_refs, project_files = render(model, up + "static/", image_index, salt, name)
+    new_fragments = dict(list(_fragments.added.items())[added:])
+    raw_size = len(html.encode("utf-8"))
+    # Font Awesome icons become an inline sprite of just the ones used
+    try:
+        html, used_icons = icons.subset_icons(html)
+    except ValueError as e:
+        raise ValueError(f"{name}: {e}") from None
+    # Non-critical CSS and the page script become hashed, cacheable files
+    html, files = assets.externalize_assets(html, up + "assets/")
+    source_sizes = {}
+    if minified:
+        html, files, source_sizes = minify_artifacts(html, files, up + "assets/")
+    return Rendered(name, html, static_refs, image_refs, files, project_files, raw_size, source_sizes, len(used_icons),
+                    _fragments.hits - hits, new_fragments, set(_fragments.used),
+                    (time.perf_counter() - t0) * 1000)
+
+# ─── Output ─────────────────────────────────────────────────
+def write_if_changed(path, data):
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+def write_artifact(name, data, source_size=None, quiet=False):
+    # Writes docs/<name> plus max-compression .gz / .br siblings for text artifacts.
+    # source_size is the size before minification, if it was minified.
+    # quiet skips the report line (for the many small project pages).
+    path = os.path.join(OUTPUT_DIR, name)
+    written = write_if_changed(path, data)
+    if name.endswith(assets.COMPRESSIBLE):
+        missing = any(not os.path.exists(path + assets.SUFFIXES[e]) for e in assets.ENCODINGS)
+        if written or missing:
+            sizes = assets.write_compressed_variants(path, data)
+        else:
+            sizes = {e: os.path.getsize(path + assets.SUFFIXES[e]) for e in assets.ENCODINGS}
+        assets.clean_stale_variants(path)
+        label = "docs/" + name
+        if source_size:
+            label += f" {source_size:,} B -> min"
+        report = assets.size_report(label, len(data), sizes)
+        if source_size:
+            report = report.replace(" B  ", f" B ({len(data) / source_size:.1%})  ", 1)
+    else:
+        report = f"docs/{name} {len(data):,} B"
+    if not quiet:
+        print(f"[OK] {report}  ({'written' if written else 'unchanged'})")
+    return written
+
+def prune_outputs(previous, manifest):
+    # Deletes what an earlier build wrote (the previous manifest's outputs)
+    # that no variant produces any more: assets with an old hash, image
+    # variants, pages of removed categories, plus .gz / .br siblings
+    keep = {n for v in manifest["variants"].values() for n in v["outputs"]}
+    stale = sorted(previous - keep)
+    for name in stale:
+        path = os.path.join(OUTPUT_DIR, name)
+        for p in [path] + [path + suffix for suffix in assets.SUFFIXES.values()]:
+            try:
+                os.remove(p)
+            except FileNotFoundError:
+                pass
+        try:
+            os.removedirs(os.path.dirname(path))  # directories left empty, e.g. api/projects/<slug>/
+        except OSError:
+            pass
+    if stale:
+        print(f"[OK] Deleted {len(stale)} stale output(s): {', '.join('docs/' + n for n in stale[:5])}"
+              + (", ..." if len(stale) > 5 else ""))
+    return stale
+
+def build(force=False, only=None, jobs=None, minified=True):
+    manifest = load_manifest()
+    old_stats = load_json(STATS_PATH, {}).get("files", {})
+    shared, stats = collect_inputs(old_stats)
+    shared["options"] = "minify" if minified else "no-minify"
+    shared["images"] = images.pipeline_id()
+
+    variants = [DEFAULT_VARIANT] + discover_variants()
+    previous_outputs = {n for v in manifest["variants"].values() for n in v["outputs"]}
+    removed = sorted(set(manifest["variants"]) - set(variants))
+    for name in removed:
+        print(f"[..] {name}: variants/{name}.json is gone, deleting its outputs")
+        del manifest["variants"][name]
+    if only:
+        unknown = sorted(set(only) - set(variants))
+        if unknown:
+            sys.exit(f"[ERROR] Unknown variant(s): {', '.join(unknown)} (have: {', '.join(variants)})")
+        variants = [v for v in variants if v in only]
+
+    todo = {}
+    for name in variants:
+        inputs = variant_inputs(name, shared, old_stats, stats)
+        previous = manifest["variants"].get(name)
+        if force:
+            reasons = ["--force"]
+        elif previous is None:
+            reasons = ["no previous build"]
+        else:
+            reasons = changed_inputs(previous["inputs"], inputs)
+            reasons += [f"docs/{n} missing" for n in missing_outputs(previous["outputs"])]
+        if reasons:
+            todo[name] = inputs
+            print(f"[..] {name}: rebuilding ({', '.join(reasons)})")
+        else:
+            print(f"[OK] {name}: up to date")
+    dump_json(STATS_PATH, {"version": MANIFEST_VERSION, "files": stats})
+    if not todo:
+        if removed:
+            prune_outputs(previous_outputs, manifest)
+            save_manifest(manifest)
+        print("[OK] Nothing to rebuild (use --force to rebuild anyway)")
+        return
+
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        base_cfg = json.load(f)
+    configs = {name: load_variant_config(base_cfg, name) for name in todo}
+    import config_model  # only once there is something to build: dataclasses is slow to import
+    models = {}
+    for name, cfg in configs.items():
+        try:
+            models[name] = config_model.load(cfg)
+        except config_model.ConfigError as e:
+            source = "config.json" if name == DEFAULT_VARIANT else f"config.json + variants/{name}.json"
+            sys.exit(f"[ERROR] {source} is invalid:\n  " + "\n  ".join(e.errors))
+    image_index = prepare_images(configs.values(), jobs)
+    # Anything besides the config that can change a section's markup
+    salt = sha256(json.dumps({k: v for k, v in shared.items() if k != "config.json"},
+                             sort_keys=True).encode("utf-8"))
+    fragment_entries = OrderedDict() if force else load_fragments()
+
+    t0 = time.perf_counter()
+    compile_template(fragment_entries)
+    compile_ms = (time.perf_counter() - t0) * 1000
+    try:
+        if len(todo) == 1 or jobs == 1:
+            results = [render_variant(name, model, minified, image_index, salt) for name, model in models.items()]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=jobs, initializer=compile_template,
+                                     initargs=(fragment_entries,)) as pool:
+                results = list(pool.map(render_variant, models.keys(), models.values(),
+                                        [minified] * len(models), [image_index] * len(models),
+                                        [salt] * len(models)))
+    except ValueError as e:
+        sys.exit(f"[ERROR] {e}")
+    save_fragments(fragment_entries, results)
+
+    timings = []
+    for r in results:
+        name, html, static_refs, image_refs, files = r.name, r.html, r.static_refs, r.image_refs, r.files
+        source_sizes = r.source_sizes
+        t1 = time.perf_counter()
+        artifacts = {variant_dir(name) + "index.html": html.encode("utf-8")}
+        print(f"[OK] {name}: " + assets.breakdown_report(r.raw_size, len(artifacts[variant_dir(name) + "index.html"]), files))
+        print(f"     sections: {r.fragments_hit} cached, {len(r.fragments_added)} rendered; "
+              f"{r.n_icons} icons inlined as an SVG sprite (Font Awesome CDN stylesheet dropped)")
+        sizes_before = {variant_dir(name) + "index.html": source_sizes.get("index.html")}
+        for asset_name, data in files.items():
+            artifacts["assets/" + asset_name] = data
+            sizes_before["assets/" + asset_name] = source_sizes.get(asset_name)
+        for rel in sorted(static_refs):
+            src = os.path.join(STATIC_DIR, rel)
+            with open(src, "rb") as f:
+                artifacts["static/" + assets.fingerprint_name(rel, assets.file_digest(src))] = f.read()
+        for rel in sorted(image_refs):
+            meta = image_index[rel]
+            for _, _, file_name in meta["variants"]:
+                with open(os.path.join(meta["dir"], file_name), "rb") as f:
+                    artifacts["static/" + images.variant_name(rel, meta["digest"], file_name)] = f.read()
+        pages = {variant_dir(name) + path: data for path, data in r.project_pages.items()}
+        written = [n for n, data in artifacts.items() if write_artifact(n, data, sizes_before.get(n))]
+        pages_written = [n for n, data in pages.items() if write_artifact(n, data, quiet=True)]
+        print(f"[OK] docs/{variant_dir(name)}api/projects/ {len(pages)} page(s), "
+              f"{sum(map(len, pages.values())):,} B  ({len(pages_written)} written)")
+        written += pages_written
+        artifacts.update(pages)
+        manifest["variants"][name] = {
+            "inputs": todo[name],
+            "outputs": {n: sha256(data) for n, data in artifacts.items()},
+        }
+        timings.append((name, r.render_ms, (time.perf_counter() - t1) * 1000,
+                        len(written), len(artifacts) - len(written)))
+    prune_outputs(previous_outputs, manifest)
+    save_manifest(manifest)
+
+    print(f"[OK] Template loaded once in {compile_ms:.1f} ms")
+    print(f"     {'variant':<16}{'render':>10}{'write':>10}  artifacts")
+    for name, render_ms, write_ms, n_written, n_same in timings:
+        print(f"     {name:<16}{render_ms:>8.1f}ms{write_ms:>8.1f}ms  {n_written} written, {n_same} unchanged")
+    print(f"[OK] Built {len(results)} variant(s) in {(time.perf_counter() - t0) * 1000:.1f} ms")
+    print(f"[OK] Ready for GitHub Pages deployment")
 
-# Load config
-with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-    cfg = json.load(f)
-
-# Pre-compute Jinja-unfriendly values
-total_tech = sum(len(s["items"]) for s in cfg.get("skills", []))
-project_categories = list(dict.fromkeys(p["category"] for p in cfg.get("projects", [])))
-
-# Extract HTML template from portfolio.py
-with open(os.path.join(BASE_DIR, "portfolio.py"), "r", encoding="utf-8") as f:
-    content = f.read()
-
-start = content.find('HTML_TEMPLATE = r"""') + len('HTML_TEMPLATE = r"""')
-end = content.find('\n"""', start)
-template_str = content[start:end]
-
-# Render
-env = Environment(autoescape=False)
-template = env.from_string(template_str)
-html = template.render(cfg=cfg, json_data=json.dumps(cfg),
-                       total_tech=total_tech,
-                       project_categories=project_categories)
-
-# Write output
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-output_path = os.path.join(OUTPUT_DIR, "index.html")
-with open(output_path, "w", encoding="utf-8") as f:
-    f.write(html)
-
-print(f"[OK] Built static site -> docs/index.html ({len(html):,} bytes)")
-print(f"[OK] Ready for GitHub Pages deployment")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the static portfolio into docs/")
+    parser.add_argument("--force", action="store_true", help="rebuild even if no input changed")
+    parser.add_argument("--variant", action="append", metavar="NAME",
+                        help="only build this variant (repeatable; 'default' = config.json)")
+    parser.add_argument("--jobs", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--no-minify", dest="minify", action="store_false",
+                        help="write HTML / CSS / JS as rendered, without minification")
+    parser.add_argument("--profile", action="store_true",
+                        help="profile the build into profiles/ (renders in this process, as --jobs 1)")
+    args = parser.parse_args()
+    if args.profile:
+        import profiling
+        with profiling.Profile("build") as profile:
+            build(force=args.force, only=args.variant, jobs=1, minified=args.minify)
+        print(f"[OK] Profile: {os.path.relpath(profile.paths[0])[:-len('.pstats')]}"
+              f".{{pstats,collapsed,alloc.txt,tracemalloc}}")
+    else:
+        build(force=args.force, only=args.variant, jobs=args.jobs, minified=args.minify)
@@ -0,0 +1,175 @@
+"""
+Config model shared by portfolio.py and build.py.
+
+load(cfg) checks a parsed config.json in a single pass and returns a Config:
+the skills and projects as slotted dataclasses plus what the page derives
+from them, computed once per config version (the app keeps it in its config
+snapshot, the build makes one per variant): the tech total, the project
+categories, projects by category (projects.build_index) and the featured
+projects.
+
+Every problem is reported at once, each with its path in the file, e.g.
+"projects[3].category is missing" or "skills[0].items[2].level must be a
+number from 0 to 100, not a string", instead of surfacing later as a Jinja
+error. The template and /api/config keep using the raw dicts (Config.raw):
+the section fragment cache keys on the config keys a section reads.
+"""
+from dataclasses import dataclass
+import projects
+
+REQUIRED_SECTIONS = ("meta", "theme", "personal")
+OBJECT_SECTIONS = REQUIRED_SECTIONS + ("social", "footer")
+LIST_SECTIONS = ("skills", "experience", "projects", "education", "certifications",
+                 "achievements", "testimonials")
+
+# Field kinds: (check, description)
+STR = (lambda v: isinstance(v, str), "a string")
+NAME = (lambda v: isinstance(v, str) and v.strip() != "", "a non-empty string")  # the template indexes into it
+STRS = (lambda v: isinstance(v, list) and all(isinstance(s, str) for s in v), "a list of strings")
+BOOL = (lambda v: isinstance(v, bool), "true or false")
+LEVEL = (lambda v: isinstance(v, (int, float)) and not isinstance(v, bool) and 0 <= v <= 100,
+         "a number from 0 to 100")
+LIST = (lambda v: isinstance(v, list), "a list")
+
+# Fields of the entries of each list section: name -> (kind, required).
+# Fields not listed here are passed through unchecked.
+ENTRY_FIELDS = {
+    "skills": {"category": (STR, True), "icon": (STR, False), "items": (LIST, True)},
+    "projects": {"title": (STR, True), "category": (STR, True), "description": (STR, False),
+                 "image": (STR, False), "tech": (STRS, False), "github": (STR, False),
+                 "live": (STR, False), "featured": (BOOL, False)},
+    "experience": {"company": (STR, False), "role": (STR, False), "duration": (STR, False),
+                   "location": (STR, False), "type": (STR, False), "logo": (STR, False),
+                   "description": (STRS, False), "tech": (STRS, False)},
+    "education": {"institution": (STR, False), "degree": (STR, False), "duration": (STR, False),
+                  "coursework": (STRS, False), "achievements": (STRS, False)},
+    "certifications": {"name": (STR, False), "issuer": (STR, False), "date": (STR, False),
+                       "link": (STR, False)},
+    "achievements": {"icon": (STR, False), "title": (STR, False), "description": (STR, False)},
+    "testimonials": {"name": (NAME, True), "role": (STR, False), "text": (STR, False),
+                     "avatar": (STR, False)},
+}
+SKILL_ITEM_FIELDS = {"name": (STR, True), "level": (LEVEL, True)}
+# Fields of the object sections checked field by field
+OBJECT_FIELDS = {
+    "personal": {"name": (NAME, True), "title": (STR, False), "tagline": (STR, False), "email": (STR, False),
+                 "phone": (STR, False), "location": (STR, False), "bio": (STR, False),
+                 "resume_link": (STR, False), "profile_image": (STR, False), "available_for_hire": (BOOL, False)},
+}
+SECTION_VALUES = {"meta": STR, "theme": STR, "social": STR}  # every value of these objects
+
+class ConfigError(ValueError):
+    """config.json failed validation; .errors lists every problem found."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("; ".join(errors))
+
+@dataclass(frozen=True, slots=True)
+class SkillItem:
+    name: str
+    level: float
+
+@dataclass(frozen=True, slots=True)
+class SkillGroup:
+    category: str
+    icon: str
+    items: tuple
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    position: int  # index in cfg["projects"]
+    title: str
+    category: str
+    description: str
+    image: str
+    tech: tuple
+    github: str
+    live: str
+    featured: bool
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    raw: dict
+    skills: tuple
+    projects: tuple
+    total_tech: int       # skill items across all groups
+    project_index: dict   # projects.build_index(): categories, members by slug, slugs
+    featured: tuple       # the featured projects, in config order
+
+    @property
+    def project_categories(self):
+        return self.project_index["categories"]
+
+def _kind(value):
+    if value is None:
+        return "null"
+    if isinstance(value, str) and not value.strip():
+        return "an empty string"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return repr(value)
+    return {bool: "true/false", str: "a string", list: "a list", dict: "an object"}.get(type(value), type(value).__name__)
+
+def _check_fields(entry, fields, path, errors):
+    # Appends an error per missing or mistyped field; False if entry is not an object
+    if not isinstance(entry, dict):
+        errors.append(f"{path} must be an object, not {_kind(entry)}")
+        return False
+    for name, ((check, what), required) in fields.items():
+        if name not in entry:
+            if required:
+                errors.append(f"{path}.{name} is missing")
+        elif not check(entry[name]):
+            errors.append(f"{path}.{name} must be {what}, not {_kind(entry[name])}")
+    return True
+
+def validate(cfg):
+    """Every problem in cfg as a list of "path message" strings (empty if valid)."""
+    if not isinstance(cfg, dict):
+        return [f"config.json must contain a JSON object, not {_kind(cfg)}"]
+    errors = []
+    for key in OBJECT_SECTIONS:
+        if key not in cfg:
+            if key in REQUIRED_SECTIONS:
+                errors.append(f"{key} section is missing")
+            continue
+        section = cfg[key]
+        if not isinstance(section, dict):
+            errors.append(f"{key} must be an object, not {_kind(section)}")
+            continue
+        if key in OBJECT_FIELDS:
+            _check_fields(section, OBJECT_FIELDS[key], key, errors)
+        if key in SECTION_VALUES:
+            check, what = SECTION_VALUES[key]
+            errors += [f"{key}.{name} must be {what}, not {_kind(v)}"
+                       for name, v in section.items() if not check(v)]
+    for key in LIST_SECTIONS:
+        entries = cfg.get(key, [])
+        if not isinstance(entries, list):
+            errors.append(f"{key} must be a list, not {_kind(entries)}")
+            continue
+        for i, entry in enumerate(entries):
+            path = f"{key}[{i}]"
+            if _check_fields(entry, ENTRY_FIELDS[key], path, errors) and key == "skills" \
+                    and isinstance(entry.get("items"), list):
+                for j, item in enumerate(entry["items"]):
+                    _check_fields(item, SKILL_ITEM_FIELDS, f"{path}.items[{j}]", errors)
+    return errors
+
+def load(cfg):
+    """The Config for a parsed config.json; raises ConfigError if it is invalid."""
+    errors = validate(cfg)
+    if errors:
+        raise ConfigError(errors)
+    skills = tuple(SkillGroup(g["category"], g.get("icon", ""),
+                              tuple(SkillItem(item["name"], item["level"]) for item in g["items"]))
+                   for g in cfg.get("skills", []))
+    project_list = tuple(Project(i, p["title"], p["category"], p.get("description", ""), p.get("image", ""),
+                                 tuple(p.get("tech", ())), p.get("github", ""), p.get("live", ""),
+                                 p.get("featured", False))
+                         for i, p in enumerate(cfg.get("projects", [])))
+    featured = tuple(p for p in project_list if p.featured)
+    return Config(raw=cfg, skills=skills, projects=project_list,
+                  total_tech=sum(len(g.items) for g in skills),
+                  project_index=projects.build_index(project_list, featured),
+                  featured=featured)
@@ -0,0 +1,120 @@
+"""
+Section fragment cache shared by portfolio.py and build.py.
+
+templates/index.html wraps each page section in {% block <name> %}. A
+section is rendered on its own and cached under a hash of the template,
+the section and the inputs it reads: the config keys it uses
+(cfg.projects, ...) and any other context variables it references
+(total_tech, ...), found once per template by walking its syntax tree. The
+page is then rendered with Jinja's block functions swapped for cached ones,
+so editing one testimonial renders the testimonials section again and
+reuses every other section.
+"""
+import hashlib, json, threading
+from collections import OrderedDict
+
+SECTIONS = ("hero", "about", "skills", "experience", "projects", "education",
+            "achievements", "testimonials", "contact")
+ALL_KEYS = "*"  # the block uses cfg as a whole (cfg|tojson, cfg[name], cfg.items(), ...)
+DICT_METHODS = frozenset(name for name in dir(dict) if not name.startswith("_"))
+DEPENDENCY_FORMAT = 2  # bumped when the analysis changes, so saved results are redone
+
+_dependencies = {}  # template digest -> {block: (config keys, context names)}
+
+def block_dependencies(env, source, digest):
+    """{block name: (frozenset of top-level cfg keys, frozenset of other names)}"""
+    deps = _dependencies.get(digest)
+    if deps is not None:
+        return deps
+    from jinja2 import nodes
+    deps = {}
+    for block in env.parse(source).find_all(nodes.Block):
+        keys, names, cfg_uses = set(), set(), 0
+        callees = {id(call.node) for call in block.find_all(nodes.Call)}
+        for node in block.find_all(nodes.Name):
+            if node.name == "cfg":
+                cfg_uses += 1
+            elif node.ctx == "load":
+                names.add(node.name)
+        for node in block.find_all((nodes.Getattr, nodes.Getitem)):
+            if isinstance(node.node, nodes.Name) and node.node.name == "cfg":
+                if isinstance(node, nodes.Getattr):
+                    if id(node) in callees or node.attr in DICT_METHODS:
+                        continue  # cfg.get(...), cfg.items(): a method, not a key
+                    keys.add(node.attr)
+                elif isinstance(node.arg, nodes.Const):
+                    keys.add(node.arg.value)
+                else:
+                    continue
+                cfg_uses -= 1
+        if cfg_uses:
+            keys.add(ALL_KEYS)
+        deps[block.name] = (frozenset(keys), frozenset(names))
+    _dependencies[digest] = deps
+    return deps
+
+def set_dependencies(digest, saved):
+    # Dependencies saved by an earlier process: {block: [keys, names]}
+    _dependencies[digest] = {block: (frozenset(keys), frozenset(names)) for block, (keys, names) in saved.items()}
+
+def fragment_key(name, digest, salt, deps, context):
+    keys, names = deps
+    cfg = context["cfg"]
+    used = cfg if ALL_KEYS in keys else {k: cfg.get(k) for k in sorted(keys)}
+    inputs = {n: context[n] for n in sorted(names) if n in context}
+    blob = json.dumps([name, digest, salt, used, inputs], sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+class FragmentCache:
+    """Bounded LRU of key -> (html, {effect name: [values]})."""
+
+    def __init__(self, size=64, entries=None):
+        self.size = size
+        self.entries = OrderedDict(entries or ())
+        self.added = {}  # entries stored since this cache was created
+        self.used = set()  # keys read or stored since then
+        self.hits = self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                self.used.add(key)
+            return entry
+
+    def put(self, key, entry):
+        with self.lock:
+            self.entries[key] = self.added[key] = entry
+            self.used.add(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+def generate(template, context, cache, env, source, digest, salt="", effects=()):
+    """Render template as a stream of strings, taking each SECTIONS block
+    from cache when its inputs are unchanged. effects names context sets the
+    template's filters add to (e.g. build.py's static_refs); each fragment
+    records what it added so a cache hit adds the same values again."""
+    ctx = template.new_context(context)
+    deps = block_dependencies(env, source, digest)
+    for name in SECTIONS:
+        if name not in template.blocks or name not in deps:
+            continue
+        key = fragment_key(name, digest, salt, deps[name], context)
+
+        def cached_block(block_ctx, name=name, key=key):
+            entry = cache.get(key)
+            if entry is None:
+                local = dict(context, **{e: set() for e in effects})
+                html = "".join(template.blocks[name](template.new_context(local)))
+                entry = (html, {e: sorted(local[e]) for e in effects})
+                cache.put(key, entry)
+            for e, values in entry[1].items():
+                context[e].update(values)
+            yield entry[0]
+        ctx.blocks[name] = [cached_block]
+    return template.root_render_func(ctx)
@@ -0,0 +1,87 @@
+"""
+Build-time Font Awesome subsetting for build.py.
+
+The rendered page's <i class="fas fa-..."></i> icons are rewritten to
+<svg><use href="#..."></svg> references into one inline sprite holding only
+the icons the page uses, taken from the vendored Font Awesome Free set in
+vendor/fontawesome/ (no network at build time). The CDN stylesheet and its
+webfonts are then no longer needed and the <link> is dropped.
+"""
+import json, os, re
+
+ICON_SET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "vendor", "fontawesome", "icons.json")
+# Class prefixes Font Awesome 5/6 use for each style
+STYLES = {"fas": "solid", "fa-solid": "solid", "far": "regular", "fa-regular": "regular",
+          "fab": "brands", "fa-brands": "brands", "fa": "solid"}
+# Utility classes that are not icon names
+MODIFIERS = re.compile(r"fa-(?:xs|sm|lg|xl|2xs|2xl|\dx|10x|fw|spin|pulse|beat|fade|flip|shake|bounce|border|inverse|li|ul|stack|stack-1x|stack-2x|rotate-\d+|pull-left|pull-right)$")
+_ICON = re.compile(r'<i\b([^>]*?)\bclass=(["\'])((?:(?!\2).)*\bfa-(?:(?!\2).)*)\2([^>]*)>\s*</i>')
+# An icon _ICON did not rewrite (text inside, unquoted class, ...): it would
+# vanish along with the CDN stylesheet
+_LEFTOVER = re.compile(r'<i\b[^>]*\bclass=[^>]*\bfa-[^>]*>(?!<svg class="icon")')
+_CDN_LINK = re.compile(r'[ \t]*<link\b[^>]*\bfont-?awesome[^>]*>\n?', re.I)
+_BODY = re.compile(r"<body\b[^>]*>")
+
+_icon_set = None
+
+def load_icon_set():
+    global _icon_set
+    if _icon_set is None:
+        with open(ICON_SET_PATH, "r", encoding="utf-8") as f:
+            _icon_set = json.load(f)
+    return _icon_set
+
+def resolve(classes):
+    """'fas fa-map-marker-alt' -> ('solid', 'location-dot'); raises KeyError."""
+    icon_set = load_icon_set()
+    names = classes.split()
+    style = next((STYLES[c] for c in names if c in STYLES), "solid")
+    icons = [c[3:] for c in names if c.startswith("fa-") and c not in STYLES and not MODIFIERS.match(c)]
+    if len(icons) != 1:
+        raise KeyError(f'class="{classes}" names {len(icons)} icons')
+    name = icon_set["aliases"].get(icons[0], icons[0])
+    if name not in icon_set["icons"][style]:
+        raise KeyError(f'class="{classes}": no {style} icon "{icons[0]}" in Font Awesome {icon_set["version"]}')
+    return style, name
+
+def subset_icons(html):
+    """Returns (html, used) with every Font Awesome <i> replaced by a sprite
+    reference, the sprite inserted after <body> and the CDN <link> removed.
+    Raises ValueError listing every icon that is not in the vendored set
+    or that cannot be rewritten."""
+    icon_set = load_icon_set()
+    used, missing = {}, []
+
+    def replace(m):
+        before, quote, classes, after = m.groups()
+        try:
+            style, name = resolve(classes)
+        except KeyError as e:
+            missing.append(e.args[0])
+            return m.group(0)
+        symbol = f"fa-{style}-{name}"
+        viewbox = icon_set["icons"][style][name][0]
+        used[symbol] = (style, name)
+        # The <i> stays so existing CSS (".contact-link i", ...) still applies
+        return (f'<i{before}class={quote}{classes}{quote}{after}><svg class="icon" viewBox="{viewbox}" aria-hidden="true">'
+                f'<use href="#{symbol}"></use></svg></i>')
+
+    html = _ICON.sub(replace, html)
+    if missing:
+        raise ValueError("missing icons:\n  " + "\n  ".join(sorted(set(missing))))
+    leftover = _LEFTOVER.findall(html)
+    if leftover:
+        raise ValueError("icons not inlined (use an empty <i> with a quoted class):\n  "
+                         + "\n  ".join(sorted(set(leftover))))
+    if not used:
+        return html, used
+    symbols = "".join(f'<symbol id="{symbol}" viewBox="{icon_set["icons"][style][name][0]}">'
+                      f'<path d="{icon_set["icons"][style][name][1]}"/></symbol>'
+                      for symbol, (style, name) in sorted(used.items()))
+    sprite = f'\n<svg xmlns="http://www.w3.org/2000/svg" style="display:none">{symbols}</svg>'
+    m = _BODY.search(html)
+    if m is None:
+        raise ValueError("no <body> to put the icon sprite in")
+    html = html[:m.end()] + sprite + html[m.end():]
+    return _CDN_LINK.sub("", html), used
@@ -0,0 +1,176 @@
+"""
+Responsive images for the static build (build.py).
+
+Every raster image referenced from config.json (personal.profile_image,
+projects[].image, testimonials[].avatar) is resized to each of WIDTHS below
+its own width, plus the original width, and encoded as AVIF and WebP (when
+this Pillow build supports them) and in its own format as the fallback.
+Results are cached in .build-cache/images/<source hash>/, so an unchanged
+image is never re-encoded. Pillow is optional (pip install Pillow); without
+it images are published as they are.
+
+Each image's size, average color and a tiny blurred placeholder (a data: URL
+of a PLACEHOLDER_WIDTH px wide WebP/JPEG) are recorded too, and collected in
+.build-cache/images/index.json, so the markup can reserve the image's box
+(width / height attributes, no layout shift) and paint the placeholder
+behind it while it loads.
+
+picture_html() renders the markup for both the build and the Flask app:
+<picture> with srcset / sizes when variants exist, a plain <img> otherwise,
+always with loading="lazy" and decoding="async".
+"""
+import base64, io, json, os
+from markupsafe import Markup, escape
+
+WIDTHS = (320, 640, 960, 1280)
+RASTER = (".jpg", ".jpeg", ".png", ".webp")
+QUALITY = {"avif": 50, "webp": 75, "jpeg": 80}
+MIME = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+EXTENSIONS = {"avif": ".avif", "webp": ".webp", "jpeg": ".jpg", "png": ".png"}
+PLACEHOLDER_WIDTH = 16  # px; the browser's upscaling blurs it further
+
+_pil = None
+
+def pillow():
+    # Imported on first use: the Flask app only needs picture_html()
+    global _pil
+    if _pil is None:
+        try:
+            from PIL import Image, ImageFilter, ImageOps, features
+            _pil = (Image, ImageFilter, ImageOps, features)
+        except ImportError:
+            _pil = False
+    return _pil or None
+
+def modern_formats():
+    pil = pillow()
+    return [fmt for fmt in ("avif", "webp") if pil and pil[3].check(fmt)]
+
+def pipeline_id():
+    # Changes whenever the same source would be encoded differently
+    pil = pillow()
+    if not pil:
+        return "none"
+    return (f"pillow-{pil[0].__version__} {' '.join(modern_formats())} {WIDTHS} {sorted(QUALITY.items())}"
+            f" lqip-{PLACEHOLDER_WIDTH}")
+
+def image_refs(cfg):
+    """Image URLs referenced from a config, in page order."""
+    refs = [cfg.get("personal", {}).get("profile_image")]
+    refs += [p.get("image") for p in cfg.get("projects", [])]
+    refs += [t.get("avatar") for t in cfg.get("testimonials", [])]
+    return [url for url in refs if url]
+
+def is_raster(rel):
+    return rel.lower().endswith(RASTER)
+
+# ─── Encoding (runs in build worker processes) ──────────────
+def placeholder(im, alpha):
+    # Average color and a tiny blurred copy; none for images with
+    # transparency, where a placeholder would show through the real image
+    if alpha:
+        return None, None
+    Image, ImageFilter, _, _ = pillow()
+    r, g, b = im.convert("RGB").resize((1, 1), Image.BOX).getpixel((0, 0))
+    color = f"#{r:02x}{g:02x}{b:02x}"
+    height = max(1, round(im.height * PLACEHOLDER_WIDTH / im.width))
+    tiny = im.resize((PLACEHOLDER_WIDTH, height), Image.BOX).filter(ImageFilter.GaussianBlur(1))
+    fmt = "webp" if "webp" in modern_formats() else "jpeg"
+    buf = io.BytesIO()
+    tiny.save(buf, fmt.upper(), quality=30)
+    return color, f"data:{MIME[fmt]};base64,{base64.b64encode(buf.getvalue()).decode('ascii')}"
+
+def cached_meta(cache_dir):
+    # None unless cache_dir holds variants encoded with the current settings
+    try:
+        with open(os.path.join(cache_dir, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("pipeline") == pipeline_id() else None
+
+def process_image(src, cache_dir):
+    """Encode every variant of src into cache_dir (skipped if already there).
+    Returns {"width", "height", "color", "placeholder",
+             "variants": [[width, format, file name], ...]}."""
+    meta = cached_meta(cache_dir)
+    if meta is not None:
+        return meta
+    meta_path = os.path.join(cache_dir, "meta.json")
+    Image, _, ImageOps, _ = pillow()
+    os.makedirs(cache_dir, exist_ok=True)
+    with Image.open(src) as im:
+        im = ImageOps.exif_transpose(im)
+        alpha = im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info)
+        im = im.convert("RGBA" if alpha else "RGB")
+        fallback = "png" if alpha or src.lower().endswith(".png") else "jpeg"
+        widths = [w for w in WIDTHS if w < im.width] + [im.width]
+        variants = []
+        for width in widths:
+            height = max(1, round(im.height * width / im.width))
+            resized = im if width == im.width else im.resize((width, height), Image.LANCZOS)
+            for fmt in modern_formats() + [fallback]:
+                name = f"{width}{EXTENSIONS[fmt]}"
+                options = {"quality": QUALITY[fmt]} if fmt in QUALITY else {"optimize": True}
+                resized.save(os.path.join(cache_dir, name), fmt.upper(), **options)
+                variants.append([width, fmt, name])
+        color, lqip = placeholder(im, alpha)
+        meta = {"width": im.width, "height": im.height, "color": color, "placeholder": lqip,
+                "variants": variants, "pipeline": pipeline_id()}
+    # meta.json last: an interrupted run leaves no half-filled cache entry behind
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(meta_path + ".tmp", meta_path)
+    return meta
+
+def write_index(path, index):
+    """index: {static rel path: meta}; keeps what the markup needs per image."""
+    keep = ("digest", "width", "height", "color", "placeholder")
+    data = {rel: {k: meta.get(k) for k in keep} for rel, meta in sorted(index.items())}
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(path + ".tmp", path)
+
+_index = (None, {})  # (mtime_ns, data)
+
+def load_index(path):
+    """The index written by the last build ({} if there is none), re-read
+    only when the file changes."""
+    global _index
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    if _index[0] != mtime:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                _index = (mtime, json.load(f))
+        except (OSError, ValueError):
+            return {}
+    return _index[1]
+
+def variant_name(rel, digest, file_name):
+    # static/me.png + 640.webp -> me.<digest>-640.webp
+    root = os.path.splitext(rel)[0]
+    return f"{root}.{digest}-{file_name}"
+
+# ─── Markup ─────────────────────────────────────────────────
+def picture_html(src, alt, sizes, sources=(), meta=None):
+    """sources: [(format, [(url, width), ...]), ...], preferred first; the
+    last one is the <img> fallback. Without sources a plain <img> is emitted.
+    meta (from the index) adds width / height and the placeholder."""
+    img = f'<img src="{escape(src)}" alt="{escape(alt)}" loading="lazy" decoding="async"'
+    if meta:
+        img += f' width="{meta["width"]}" height="{meta["height"]}"'
+        if meta.get("color"):
+            background = meta["color"]
+            if meta.get("placeholder"):
+                background += f" url({meta['placeholder']}) 50%/cover no-repeat"
+            img += f' style="background:{background}"'
+    if not sources:
+        return Markup(img + ">")
+    srcsets = [(fmt, ", ".join(f"{escape(url)} {w}w" for url, w in entries)) for fmt, entries in sources]
+    parts = [f'<source type="{MIME[fmt]}" srcset="{srcset}" sizes="{escape(sizes)}">'
+             for fmt, srcset in srcsets[:-1]]
+    parts.append(f'{img} srcset="{srcsets[-1][1]}" sizes="{escape(sizes)}">')
+    return Markup("<picture>" + "".join(parts) + "</picture>")
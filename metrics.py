@@ -0,0 +1,213 @@
+"""
+Request metrics for portfolio.py: Server-Timing headers and a Prometheus
+/metrics endpoint.
+
+Counters and histograms live in a per-process Registry; recording one is a
+lock, a dict lookup and (for histograms) a bisect, so it stays cheap on the
+hot path. The pre-forking server (server.py) runs several worker processes,
+each with its own registry: with share(directory) every process writes its
+values to <directory>/<pid>.json once per FLUSH_INTERVAL, and render() adds
+up every process's file so any worker can answer a scrape. Files of workers
+that exited stay, so counters never go backwards.
+"""
+import bisect, json, os, threading, time
+
+FLUSH_INTERVAL = 1.0  # seconds; a scrape sees other workers' values this late at most
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+def labels(**pairs):
+    """Label set as a hashable, ordered tuple; build these once, not per request."""
+    return tuple(pairs.items())
+
+def _format_labels(pairs, extra=()):
+    items = list(pairs) + list(extra)
+    if not items:
+        return ""
+    escape = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in items) + "}"
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.meta = {}    # name -> (type, help, buckets)
+        self.values = {}  # name -> {labels: number, or [bucket counts..., sum, count]}
+        self.collectors = []  # functions returning {(name, labels): value}, read at snapshot time
+        self.directory = None
+        self._flusher_pid = None
+
+    def counter(self, name, help):
+        self.meta[name] = ("counter", help, None)
+        self.values[name] = {}
+        return name
+
+    def histogram(self, name, help, buckets):
+        self.meta[name] = ("histogram", help, tuple(buckets))
+        self.values[name] = {}
+        return name
+
+    def inc(self, name, pairs=(), amount=1):
+        series = self.values[name]
+        with self.lock:
+            series[pairs] = series.get(pairs, 0) + amount
+        self._start_flusher()
+
+    def observe(self, name, pairs, value):
+        buckets = self.meta[name][2]
+        series = self.values[name]
+        i = bisect.bisect_left(buckets, value)
+        with self.lock:
+            counts = series.get(pairs)
+            if counts is None:
+                counts = series[pairs] = [0] * (len(buckets) + 2)
+            if i < len(buckets):
+                counts[i] += 1  # per-bucket for now; made cumulative in render()
+            counts[-2] += value
+            counts[-1] += 1
+        self._start_flusher()
+
+    def collect(self, fn):
+        self.collectors.append(fn)
+
+    def snapshot(self):
+        with self.lock:
+            data = {name: [[list(pairs), list(v) if isinstance(v, list) else v] for pairs, v in series.items()]
+                    for name, series in self.values.items()}
+        for fn in self.collectors:
+            for (name, pairs), value in fn().items():
+                data.setdefault(name, []).append([list(pairs), value])
+        return data
+
+    # ─── Sharing between worker processes ───────────────────
+    def share(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def _start_flusher(self):
+        # One flusher thread per process, started on first use (threads do
+        # not survive fork, so a forked worker starts its own)
+        if self.directory is None or self._flusher_pid == os.getpid():
+            return
+        self._flusher_pid = os.getpid()
+        threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True).start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self):
+        path = os.path.join(self.directory, f"{os.getpid()}.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+
+    def _snapshots(self):
+        yield self.snapshot()
+        if self.directory is None:
+            return
+        own = f"{os.getpid()}.json"
+        for name in os.listdir(self.directory):
+            if name.endswith(".json") and name != own:
+                try:
+                    with open(os.path.join(self.directory, name), "r", encoding="utf-8") as f:
+                        yield json.load(f)
+                except (OSError, ValueError):
+                    continue  # being replaced right now; picked up next scrape
+
+    # ─── Prometheus text format ─────────────────────────────
+    def render(self):
+        merged = {}  # name -> {labels: value}
+        for snap in self._snapshots():
+            for name, entries in snap.items():
+                series = merged.setdefault(name, {})
+                for pairs, value in entries:
+                    key = tuple(map(tuple, pairs))
+                    if isinstance(value, list):
+                        old = series.get(key)
+                        series[key] = value if old is None else [a + b for a, b in zip(old, value)]
+                    else:
+                        series[key] = series.get(key, 0) + value
+        lines = []
+        for name, series in merged.items():
+            kind, help, buckets = self.meta.get(name, ("gauge", "", None))
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for pairs, value in sorted(series.items()):
+                if kind != "histogram":
+                    lines.append(f"{name}{_format_labels(pairs)} {_number(value)}")
+                    continue
+                running = 0
+                for bound, count in zip(buckets, value):
+                    running += count
+                    lines.append(f"{name}_bucket{_format_labels(pairs, [('le', bound)])} {running}")
+                lines.append(f"{name}_bucket{_format_labels(pairs, [('le', '+Inf')])} {value[-1]}")
+                lines.append(f"{name}_sum{_format_labels(pairs)} {_number(value[-2])}")
+                lines.append(f"{name}_count{_format_labels(pairs)} {value[-1]}")
+        lines += self._hit_ratios(merged)
+        return "\n".join(lines) + "\n"
+
+    def _hit_ratios(self, merged):
+        # portfolio_cache_hit_ratio{cache=...} from the hit / miss counters
+        totals = {}
+        for pairs, value in merged.get(CACHE_REQUESTS, {}).items():
+            d = dict(pairs)
+            hits, total = totals.get(d.get("cache"), (0, 0))
+            totals[d.get("cache")] = (hits + (value if d.get("result") == "hit" else 0), total + value)
+        if not totals:
+            return []
+        lines = ["# HELP portfolio_cache_hit_ratio Share of cache lookups that were hits, since start.",
+                 "# TYPE portfolio_cache_hit_ratio gauge"]
+        for cache, (hits, total) in sorted(totals.items()):
+            lines.append(f"portfolio_cache_hit_ratio{_format_labels([('cache', cache)])} "
+                         f"{_number(hits / total if total else 0.0)}")
+        return lines
+
+REGISTRY = Registry()
+REQUESTS = REGISTRY.counter("portfolio_requests_total", "Requests handled, by route, method and status.")
+LATENCY = REGISTRY.histogram("portfolio_request_duration_seconds",
+                             "Time from request start to the last body byte, by route.", LATENCY_BUCKETS)
+RESPONSE_SIZE = REGISTRY.histogram("portfolio_response_size_bytes",
+                                   "Response body size as sent (after compression), by route.", SIZE_BUCKETS)
+CACHE_REQUESTS = REGISTRY.counter("portfolio_cache_requests_total", "Cache lookups, by cache and result.")
+
+# ─── Server-Timing ──────────────────────────────────────────
+class ServerTiming:
+    """Durations of one request's phases, for its Server-Timing header.
+    with timing.phase("render"): ... adds the block's duration to "render"
+    (phases do not nest)."""
+    __slots__ = ("start", "phases", "_name", "_t0")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = {}  # name -> [ms or None, description or None], in first-use order
+
+    def phase(self, name):
+        self._name = name
+        return self
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+
+    def __exit__(self, *exc):
+        ms = (time.perf_counter() - self._t0) * 1000
+        entry = self.phases.get(self._name)
+        if entry is None:
+            self.phases[self._name] = [ms, None]
+        else:
+            entry[0] = (entry[0] or 0.0) + ms
+
+    def note(self, name, description):
+        self.phases.setdefault(name, [None, None])[1] = description
+
+    def header(self):
+        parts = []
+        for name, (ms, description) in self.phases.items():
+            if description:
+                name += f';desc="{description}"'
+            parts.append(name if ms is None else f"{name};dur={ms:.2f}")
+        parts.append(f"total;dur={(time.perf_counter() - self.start) * 1000:.2f}")
+        return ", ".join(parts)
@@ -0,0 +1,116 @@
+"""
+Conservative HTML / CSS / JS minifiers for the static build (build.py).
+
+They only remove what is provably insignificant: comments, indentation and
+runs of whitespace. They never rewrite attributes, quotes or identifiers.
+<pre> and <textarea> contents are left byte-for-byte alone, and multi-line
+JS template literals are kept verbatim.
+"""
+import re
+
+# ─── CSS ────────────────────────────────────────────────────
+_CSS_TOKENS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|(/\*.*?\*/)|(\s+)', re.S)
+_CSS_PUNCT = re.compile(r"\s*([{};,>])\s*")
+
+def minify_css(css):
+    # Strings are kept as-is; comments go; whitespace runs become one space,
+    # then spaces next to punctuation are dropped. '+', '-' and '~' are left
+    # alone (calc() needs the spaces around them).
+    out = []
+    for m_code, string in _css_segments(css):
+        if string:
+            out.append(m_code)
+        else:
+            code = _CSS_PUNCT.sub(r"\1", m_code)
+            out.append(re.sub(r":\s+", ":", code).replace(";}", "}"))
+    return "".join(out).strip()
+
+def _css_segments(css):
+    # Yields (text, is_string) with comments removed and whitespace collapsed
+    pos, code = 0, []
+    for m in _CSS_TOKENS.finditer(css):
+        code.append(css[pos:m.start()])
+        string, comment, space = m.groups()
+        if string:
+            yield "".join(code), False
+            code = []
+            yield string, True
+        elif space:
+            code.append(" ")
+        pos = m.end()
+    code.append(css[pos:])
+    yield "".join(code), False
+
+# ─── JS ─────────────────────────────────────────────────────
+def minify_js(js):
+    # Line-based: drops indentation, blank lines and whole-line // comments,
+    # but keeps every newline so automatic semicolon insertion is unaffected.
+    out, in_template = [], False
+    for line in js.splitlines():
+        if in_template:
+            out.append(line)
+        else:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("//"):
+                continue
+            out.append(stripped)
+        if line.count("`") % 2:
+            in_template = not in_template
+    return "\n".join(out)
+
+# ─── HTML ───────────────────────────────────────────────────
+# A tag is '<' + name + attributes, where quoted attribute values may contain
+# '<' or '>' (e.g. the inline SVG favicon data: URL).
+_HTML_TOKENS = re.compile(r"""(<!--.*?-->)|(<[a-zA-Z/!](?:"[^"]*"|'[^']*'|[^'">])*>)""", re.S)
+_RAW_TEXT = ("script", "style", "pre", "textarea")
+_BLOCK_TAGS = {"html", "head", "body", "meta", "link", "title", "style", "script", "noscript",
+               "div", "section", "nav", "header", "footer", "main", "ul", "ol", "li",
+               "h1", "h2", "h3", "h4", "h5", "h6", "p", "svg", "symbol", "defs", "picture", "source"}
+
+def _tag_name(tag):
+    m = re.match(r"</?([a-zA-Z0-9]+)", tag)
+    return m.group(1).lower() if m else ""
+
+def minify_html(html):
+    out = []  # list of (kind, text) with kind in {"text", "tag", "raw"}
+    pos, raw_until = 0, None
+    for m in _HTML_TOKENS.finditer(html):
+        if raw_until is not None:
+            # Inside <script>/<style>/<pre>/<textarea>: skip until its closing tag
+            if m.group(2) and m.group(2).lower().startswith(raw_until):
+                out.append(("raw", html[pos:m.start()]))
+                out.append(("tag", m.group(2)))
+                pos, raw_until = m.end(), None
+            continue
+        out.append(("text", html[pos:m.start()]))
+        comment, tag = m.groups()
+        if comment:
+            if comment.startswith("<!--[if"):
+                out.append(("tag", comment))
+        else:
+            out.append(("tag", tag))
+            name = _tag_name(tag)
+            if not tag.startswith("</") and name in _RAW_TEXT:
+                raw_until = f"</{name}"
+        pos = m.end()
+    out.append(("raw" if raw_until else "text", html[pos:]))
+
+    result = []
+    for i, (kind, text) in enumerate(out):
+        if kind == "text":
+            text = re.sub(r"\s+", " ", text)
+            # Whitespace next to block-level tags never renders
+            prev_tag = out[i - 1][1] if i and out[i - 1][0] == "tag" else ""
+            next_tag = out[i + 1][1] if i + 1 < len(out) and out[i + 1][0] == "tag" else ""
+            if not prev_tag or _tag_name(prev_tag) in _BLOCK_TAGS:
+                text = text.lstrip()
+            if not next_tag or _tag_name(next_tag) in _BLOCK_TAGS:
+                text = text.rstrip()
+        elif kind == "raw":
+            opener = _tag_name(out[i - 1][1])
+            if opener == "style":
+                text = minify_css(text)
+            elif opener == "script" and "src=" not in out[i - 1][1]:
+                text = minify_js(text)
+        result.append(text)
+    return "".join(result)
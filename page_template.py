@@ -0,0 +1,77 @@
+"""
+The page template, templates/index.html, shared by portfolio.py and build.py.
+
+source() reads the file once, on first use. load() compiles it through a
+Jinja FileSystemBytecodeCache in .build-cache/jinja/, so a fresh process (a
+build, a restarted server, a pool worker) unmarshals the compiled code
+instead of parsing and compiling ~1,200 lines of template again. The
+section dependencies fragments.py finds by parsing the template are kept
+next to it for the same reason.
+"""
+import hashlib, json, os
+from collections import namedtuple
+import fragments
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
+NAME = "index.html"
+PATH = os.path.join(TEMPLATES_DIR, NAME)
+CACHE_DIR = os.path.join(BASE_DIR, ".build-cache", "jinja")
+
+Source = namedtuple("Source", "text digest mtime")
+_source = None
+
+def source():
+    """Text, sha256 and mtime of the template, read on first use."""
+    global _source
+    if _source is None:
+        with open(PATH, "r", encoding="utf-8") as f:
+            text = f.read()
+        _source = Source(text, hashlib.sha256(text.encode("utf-8")).hexdigest(), os.path.getmtime(PATH))
+    return _source
+
+def load(env, kind):
+    """The compiled template for env. kind ("app", "build") gives each
+    environment its own cache directory: the compiled code depends on env
+    options such as autoescape, which Jinja's cache key does not cover."""
+    from jinja2 import FileSystemBytecodeCache
+    src = source()
+    directory = os.path.join(CACHE_DIR, kind)
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        directory = None  # read-only checkout: compile in memory every time
+    if directory is None:
+        code = env.compile(src.text, NAME, PATH)
+    else:
+        # What jinja2.BaseLoader.load() does, for a source read by source()
+        cache = FileSystemBytecodeCache(directory)
+        bucket = cache.get_bucket(env, NAME, PATH, src.text)
+        code = bucket.code
+        if code is None:
+            code = bucket.code = env.compile(src.text, NAME, PATH)
+            try:
+                cache.set_bucket(bucket)
+            except OSError:
+                pass
+        _load_dependencies(env, src, directory)
+    return env.template_class.from_code(env, code, env.make_globals(None), None)
+
+def _load_dependencies(env, src, directory):
+    path = os.path.join(directory, f"dependencies-{fragments.DEPENDENCY_FORMAT}-{src.digest[:16]}.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            fragments.set_dependencies(src.digest, json.load(f))
+        return
+    except (OSError, ValueError):
+        pass
+    deps = fragments.block_dependencies(env, src.text, src.digest)
+    try:
+        for name in os.listdir(directory):
+            if name.startswith("dependencies-"):
+                os.remove(os.path.join(directory, name))  # an older template's
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({block: [sorted(keys), sorted(names)] for block, (keys, names) in deps.items()}, f)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
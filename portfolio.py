@@ -5,1048 +5,838 @@
 ║  Edit config.json to update all content & theming.           ║
 ╚══════════════════════════════════════════════════════════════╝
 """
-import json, os, webbrowser, threading
-from flask import Flask, render_template_string, send_from_directory, jsonify
+import json, os, sys, io, mimetypes, select, webbrowser, threading, time, struct, hashlib
+from collections import namedtuple, OrderedDict
+from contextlib import nullcontext
+import assets, config_model, fragments, images, metrics, page_template, projects, vitals
+from flask import Flask, Response, request, abort, send_file
+from werkzeug.security import safe_join
 
 # ─── Load config ────────────────────────────────────────────
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(BASE_DIR, "config.json")
 
-def load_config():
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-app = Flask(__name__)
+app = Flask(__name__, static_folder=None)  # /static is served by static_files() below
+
+# ─── Request metrics (see metrics.py) ───────────────────────
+# Every response carries a Server-Timing header (config, context, render,
+# serialize, ...) and is counted in the Prometheus metrics at /metrics.
+# PORTFOLIO_METRICS=0 turns both off.
+app.config.setdefault("METRICS", os.environ.get("PORTFOLIO_METRICS", "1") != "0")
+CACHE_HIT, CACHE_MISS = {}, {}  # cache name -> label set
+for _cache in ("page", "config", "static", "fragment"):
+    CACHE_HIT[_cache] = metrics.labels(cache=_cache, result="hit")
+    CACHE_MISS[_cache] = metrics.labels(cache=_cache, result="miss")
+
+_timing = threading.local()  # .current: the ServerTiming of this thread's request
+
+def phase(name):
+    # Times one step of the current request for its Server-Timing header
+    timing = getattr(_timing, "current", None)
+    return timing.phase(name) if timing is not None else nullcontext()
+
+def count_cache(cache, hit):
+    metrics.REGISTRY.inc(metrics.CACHE_REQUESTS, CACHE_HIT[cache] if hit else CACHE_MISS[cache])
+
+@app.before_request
+def start_timing():
+    _timing.current = metrics.ServerTiming() if app.config["METRICS"] else None
+
+@app.after_request
+def record_metrics(resp):
+    timing = getattr(_timing, "current", None)
+    if timing is None:
+        return resp
+    _timing.current = None
+    resp.headers["Server-Timing"] = timing.header()
+    rule = request.url_rule
+    route_labels = (("route", rule.rule if rule is not None else "<unmatched>"),)
+    request_labels = route_labels + (("method", request.method), ("status", str(resp.status_code)))
+
+    def done(size):
+        registry = metrics.REGISTRY
+        registry.inc(metrics.REQUESTS, request_labels)
+        registry.observe(metrics.LATENCY, route_labels, time.perf_counter() - timing.start)
+        registry.observe(metrics.RESPONSE_SIZE, route_labels, size)
+
+    size = resp.content_length
+    if size is not None or not resp.is_streamed:
+        done(size if size is not None else len(resp.get_data()))
+    else:
+        # Streamed body: recorded once the last chunk has gone out
+        def counted(body):
+            size = 0
+            try:
+                for chunk in body:
+                    size += len(chunk)
+                    yield chunk
+            finally:
+                done(size)
+        resp.response = counted(resp.response)
+    return resp
+
+@app.route("/metrics")
+def metrics_endpoint():
+    if not app.config["METRICS"]:
+        abort(404)
+    return Response(metrics.REGISTRY.render(), mimetype="text/plain; version=0.0.4")
+
+# ─── Profiling (see profiling.py) ───────────────────────────
+# With PORTFOLIO_PROFILE=1, any URL plus ?__profile=1 writes cProfile,
+# sampled-stack and allocation profiles of that request to profiles/.
+# Otherwise the middleware is not installed at all.
+if os.environ.get("PORTFOLIO_PROFILE", "0") != "0":
+    import profiling
+    app.wsgi_app = profiling.ProfilerMiddleware(app.wsgi_app)
+
+# ─── Config snapshot (swapped atomically on change) ─────────
+# Requests read the current snapshot without locking or touching the disk.
+# Only the watcher (or the very first request) parses config.json, and a
+# file that fails to parse or validate never replaces the last good one.
+# version is the file's mtime in ms, bumped if needed to stay increasing, so
+# every worker process (and a restarted one) numbers the same file the same.
+# model is the validated config_model.Config, with the data derived from it;
+# static is static_salt() of the files it references, refreshed by the watcher.
+ConfigSnapshot = namedtuple("ConfigSnapshot", "cfg raw digest mtime_ns size version model static")
+CONFIG_HISTORY_SIZE = 16  # past versions /api/config?since= can diff against
+_snapshot = None
+_config_history = OrderedDict()  # version -> cfg
+_snapshot_lock = threading.Lock()
+_watcher_started = False
+
+def refresh_config():
+    global _snapshot
+    with _snapshot_lock:
+        current = _snapshot
+        try:
+            with open(CONFIG_PATH, "rb") as f:
+                raw = f.read()
+                st = os.fstat(f.fileno())
+        except OSError as e:
+            if current is None:
+                raise
+            app.logger.warning("Cannot read config.json, keeping version %d: %s", current.version, e)
+            return current
+        if current is not None and (st.st_mtime_ns, st.st_size) == (current.mtime_ns, current.size):
+            return current
+        try:
+            cfg = json.loads(raw)
+            model = config_model.load(cfg)
+        except ValueError as e:
+            if current is None:
+                raise
+            app.logger.warning("Rejected config.json edit, keeping version %d: %s", current.version, e)
+            # Remember the stat so a broken file is not re-parsed until it changes again
+            _snapshot = current._replace(mtime_ns=st.st_mtime_ns, size=st.st_size)
+            return _snapshot
+        version = st.st_mtime_ns // 1_000_000
+        if current is not None:
+            version = max(version, current.version + 1)
+        _snapshot = ConfigSnapshot(cfg, raw, hashlib.sha256(raw).hexdigest(),
+                                   st.st_mtime_ns, st.st_size, version, model, static_salt(cfg))
+        _config_history[version] = cfg
+        while len(_config_history) > CONFIG_HISTORY_SIZE:
+            _config_history.popitem(last=False)
+        if current is not None:
+            app.logger.info("Loaded config.json version %d", version)
+        return _snapshot
+
+def refresh_static():
+    # A static file or the image index changed: re-hash what the page references
+    global _snapshot
+    with _snapshot_lock:
+        current = _snapshot
+        if current is not None:
+            salt = static_salt(current.cfg)
+            if salt != current.static:
+                _snapshot = current._replace(static=salt)
+        return _snapshot
+
+def get_snapshot():
+    snap = _snapshot
+    if snap is None:
+        snap = refresh_config()
+    if not _watcher_started:
+        # Also covers forked workers, which inherit a snapshot but no watcher thread
+        start_config_watcher()
+    return snap
+
+def get_config():
+    return get_snapshot().cfg
+
+# ─── File watcher: inotify on Linux, stat polling elsewhere ─
+IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x008, 0x040, 0x080, 0x100, 0x200
+WATCH_DEBOUNCE = 0.1  # seconds of quiet before a burst of file events is acted on
+
+def _inotify_loop(paths, callback):
+    import ctypes, ctypes.util
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    fd = libc.inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    # Watch the directories: editors often save by writing a temp file and renaming it.
+    # A watched directory path counts every file in it (and its subdirectories).
+    wanted = {}  # directory -> file names that matter there, None for all
+    for p in paths:
+        if os.path.isdir(p):
+            for d, _, _ in os.walk(p):
+                wanted[d] = None
+        elif wanted.get(os.path.dirname(p), ()) is not None:
+            wanted.setdefault(os.path.dirname(p), set()).add(os.path.basename(p))
+    watches = {}  # watch descriptor -> names
+    for d, names in wanted.items():
+        wd = libc.inotify_add_watch(fd, os.fsencode(d), IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                                    IN_CREATE | IN_DELETE)
+        if wd < 0:
+            os.close(fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {d}")
+        watches[wd] = names
+    callback()  # catch edits made before the watches were in place
+    while True:
+        buf, offset, changed = os.read(fd, 64 * 1024), 0, False
+        while offset < len(buf):
+            wd, mask, _, length = struct.unpack_from("iIII", buf, offset)
+            name = buf[offset + 16:offset + 16 + length].rstrip(b"\0")
+            names = watches.get(wd, ())
+            changed = changed or names is None or os.fsdecode(name) in names
+            offset += 16 + length
+        if changed:
+            # Editors often save in several steps (truncate, write, rename)
+            while select.select([fd], [], [], WATCH_DEBOUNCE)[0]:
+                os.read(fd, 64 * 1024)
+            callback()
+
+def _poll_loop(paths, callback, interval):
+    while True:
+        time.sleep(interval)
+        callback()
+
+def watch_files(paths, callback, interval=1.0):
+    def run():
+        if sys.platform.startswith("linux"):
+            try:
+                _inotify_loop(paths, callback)
+            except OSError as e:
+                app.logger.warning("inotify unavailable (%s), falling back to polling", e)
+        _poll_loop(paths, callback, interval)
+    thread = threading.Thread(target=run, name="file-watcher", daemon=True)
+    thread.start()
+    return thread
+
+def _safe_refresh():
+    before = _snapshot
+    try:
+        refresh_config()
+        after = refresh_static()
+    except Exception:
+        app.logger.exception("Config reload failed")
+        return
+    if before is not None and (after.version, after.static) != (before.version, before.static):
+        live_events.publish(before, after)
+
+def start_config_watcher():
+    global _watcher_started
+    with _snapshot_lock:
+        if _watcher_started:
+            return
+        _watcher_started = True
+    # static/ and the image index feed static_salt(); a missing index
+    # directory is created so the build writing it later is seen too
+    try:
+        os.makedirs(os.path.dirname(IMAGE_INDEX_PATH), exist_ok=True)
+    except OSError:
+        pass
+    watch_files([CONFIG_PATH, STATIC_DIR, IMAGE_INDEX_PATH], _safe_refresh)
 
 # ─── Serve uploaded images from /static folder ──────────────
 STATIC_DIR = os.path.join(BASE_DIR, "static")
 os.makedirs(STATIC_DIR, exist_ok=True)
 
+# Files are referenced through content-hashed URLs (see the static_url
+# filter), which can be cached as immutable. Small files are kept in a
+# bounded in-memory LRU; large ones are streamed from disk through the
+# server's wsgi.file_wrapper (sendfile where the server supports it).
+STATIC_MEMORY_MAX_FILE = 256 * 1024
+STATIC_MEMORY_BUDGET = 32 * 1024 * 1024
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+_static_lru = OrderedDict()  # path -> (mtime_ns, size, bytes)
+_static_lru_bytes = 0
+_static_lru_lock = threading.Lock()
+
+def _read_static(path, st):
+    global _static_lru_bytes
+    with _static_lru_lock:
+        entry = _static_lru.get(path)
+        if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+            _static_lru.move_to_end(path)
+            hit = True
+        else:
+            hit = False
+    count_cache("static", hit)
+    if hit:
+        return entry[2]
+    with open(path, "rb") as f:
+        data = f.read()
+    with _static_lru_lock:
+        old = _static_lru.pop(path, None)
+        if old is not None:
+            _static_lru_bytes -= len(old[2])
+        _static_lru[path] = (st.st_mtime_ns, st.st_size, data)
+        _static_lru_bytes += len(data)
+        while _static_lru_bytes > STATIC_MEMORY_BUDGET:
+            _, evicted = _static_lru.popitem(last=False)
+            _static_lru_bytes -= len(evicted[2])
+    return data
+
+@app.template_filter("static_url")
+def static_url_filter(url):
+    return assets.static_url(url, STATIC_DIR)
+
+IMAGE_INDEX_PATH = os.path.join(BASE_DIR, ".build-cache", "images", "index.json")
+
+@app.template_global("responsive_image")
+def responsive_image(url, alt, sizes):
+    # Resized / AVIF / WebP variants only exist in the static build (build.py),
+    # but its image index still gives size and placeholder when it is current
+    rel = assets.static_relpath(url, STATIC_DIR)
+    meta = images.load_index(IMAGE_INDEX_PATH).get(rel) if rel else None
+    if meta and meta["digest"] != assets.file_digest(os.path.join(STATIC_DIR, rel)):
+        meta = None
+    return images.picture_html(static_url_filter(url), alt, sizes, meta=meta)
+
+def link_refs(cfg):
+    # Links the template passes through static_url besides the images
+    return [cfg.get("personal", {}).get("resume_link")] + [c.get("link") for c in cfg.get("certifications", [])]
+
+def static_salt(cfg):
+    # The page bakes in fingerprinted /static URLs and the image index's sizes:
+    # hash what they come from, as build.py's fragment salt does
+    refs = []
+    for url in images.image_refs(cfg) + link_refs(cfg):
+        rel = assets.static_relpath(url, STATIC_DIR)
+        if rel:
+            refs.append(f"{rel}:{assets.file_digest(os.path.join(STATIC_DIR, rel))}")
+    try:
+        refs.append(str(os.stat(IMAGE_INDEX_PATH).st_mtime_ns))
+    except OSError:
+        pass
+    return hashlib.sha256("\n".join(refs).encode()).hexdigest()[:16]
+
 @app.route("/static/<path:filename>")
 def static_files(filename):
-    return send_from_directory(STATIC_DIR, filename)
+    name, fingerprint = assets.split_fingerprint(filename)
+    with phase("file"):
+        path = safe_join(STATIC_DIR, name)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        st = os.stat(path)
+        digest = assets.file_digest(path)
+        mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        if st.st_size <= STATIC_MEMORY_MAX_FILE:
+            source = io.BytesIO(_read_static(path, st))
+        else:
+            source = path
+    immutable = fingerprint == digest
+    # An unhashed or outdated URL still gets the file, but must be revalidated
+    resp = send_file(source, mimetype=mimetype, conditional=True, etag=digest,
+                     last_modified=st.st_mtime, max_age=IMMUTABLE_MAX_AGE if immutable else None)
+    if immutable:
+        resp.cache_control.immutable = True
+    return resp
+
+# ─── Config API (live refresh) ──────────────────────────────
+# GET /api/config                  whole config
+# GET /api/config/<section>        one top-level section, e.g. /api/config/projects
+# GET /api/config?since=<version>  RFC 6902 JSON Patch from that version to the current one
+# Every response carries X-Config-Version and a strong ETag, so polling
+# clients get a 304 until the part they asked for actually changes.
+_config_bodies = OrderedDict()  # (version, section) -> (body, etag)
+
+def config_body(snap, section=None):
+    key = (snap.version, section)
+    cached = _config_bodies.get(key)
+    count_cache("config", cached is not None)
+    if cached is None:
+        data = snap.cfg if section is None else snap.cfg[section]
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        cached = _config_bodies[key] = (body, hashlib.sha256(body).hexdigest()[:32])
+        while len(_config_bodies) > 4 * CONFIG_HISTORY_SIZE:
+            _config_bodies.popitem(last=False)
+    return cached
+
+def _pointer(path):
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in path)
+
+def json_diff(old, new, path=()):
+    """RFC 6902 operations turning old into new."""
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": _pointer(path), "value": new}]
+    if isinstance(old, dict):
+        ops = [{"op": "remove", "path": _pointer(path + (k,))} for k in old if k not in new]
+        for k, v in new.items():
+            if k not in old:
+                ops.append({"op": "add", "path": _pointer(path + (k,)), "value": v})
+            else:
+                ops += json_diff(old[k], v, path + (k,))
+        return ops
+    if isinstance(old, list):
+        ops = []
+        for i, (a, b) in enumerate(zip(old, new)):
+            ops += json_diff(a, b, path + (i,))
+        # Remove from the end backwards so earlier indexes stay valid
+        ops += [{"op": "remove", "path": _pointer(path + (i,))} for i in range(len(old) - 1, len(new) - 1, -1)]
+        ops += [{"op": "add", "path": _pointer(path + ("-",)), "value": v} for v in new[len(old):]]
+        return ops
+    return [] if old == new else [{"op": "replace", "path": _pointer(path), "value": new}]
+
+def config_response(body, etag, snap, mimetype="application/json"):
+    resp = Response(body, mimetype=mimetype)
+    resp.set_etag(etag)
+    resp.headers["X-Config-Version"] = str(snap.version)
+    resp.cache_control.no_cache = True
+    return resp.make_conditional(request)
 
-# ─── API endpoint to reload config (live refresh) ───────────
 @app.route("/api/config")
 def api_config():
-    return jsonify(load_config())
+    with phase("config"):
+        snap = get_snapshot()
+    since = request.args.get("since")
+    if since is not None:
+        try:
+            since = int(since)
+        except ValueError:
+            abort(400, "since must be a config version number")
+        base = _config_history.get(since)
+        if base is not None:
+            with phase("serialize"):
+                patch = json_diff(base, snap.cfg)
+                body = json.dumps(patch, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            return config_response(body, f"{snap.digest[:32]}-since-{since}", snap,
+                                   "application/json-patch+json")
+        # Version unknown here (too old, or from before a restart): send it all
+    with phase("serialize"):
+        body, etag = config_body(snap)
+    return config_response(body, etag, snap)
+
+@app.route("/api/config/<section>")
+def api_config_section(section):
+    with phase("config"):
+        snap = get_snapshot()
+    if section not in snap.cfg:
+        abort(404)
+    with phase("serialize"):
+        body, etag = config_body(snap, section)
+    return config_response(body, etag, snap)
+
+# ─── Projects API ───────────────────────────────────────────
+# GET /api/projects?category=<name or slug>&page=<n>&size=<n>
+# The page renders the first page of cards; the filter buttons and "Load
+# more" fetch the rest from here (from build.py's static pages when deployed).
+def card_picture(proj):
+    return responsive_image(proj["image"], proj["title"], projects.IMAGE_SIZES)
+
+@app.route("/api/projects")
+def api_projects():
+    with phase("config"):
+        snap = get_snapshot()
+    index = snap.model.project_index
+    slug = projects.resolve_category(index, request.args.get("category", ""))
+    if slug is None:
+        abort(404, "no such project category")
+    try:
+        page = int(request.args.get("page", 1))
+        size = int(request.args.get("size", projects.PAGE_SIZE))
+    except ValueError:
+        abort(400, "page and size must be numbers")
+    if page < 1 or not 1 <= size <= projects.MAX_PAGE_SIZE:
+        abort(400, f"page must be at least 1 and size between 1 and {projects.MAX_PAGE_SIZE}")
+    if page > projects.page_count(len(index["members"][slug]), size):
+        abort(404, "no such page")
+    with phase("context"):
+        data = projects.project_page(snap.cfg.get("projects", []), index, slug, page, size, card_picture)
+    with phase("serialize"):
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return config_response(body, hashlib.sha256(body).hexdigest()[:32], snap)
+
+# ─── Web Vitals (see vitals.py) ─────────────────────────────
+# The page beacons its LCP, CLS, INP and TTFB here; samples are written to
+# VITALS_DB in batches off the request path. "python vitals.py report"
+# summarizes them. PORTFOLIO_VITALS=0 turns collection off.
+app.config.setdefault("VITALS", os.environ.get("PORTFOLIO_VITALS", "1") != "0")
+_vitals = vitals.SampleWriter(vitals.DB_PATH)
+
+@app.route("/api/vitals", methods=["POST"])
+def api_vitals():
+    if not app.config["VITALS"]:
+        abort(404)
+    # A chunked body has no Content-Length: read one byte past the limit to tell
+    data = request.stream.read(vitals.MAX_BEACON_BYTES + 1)
+    if len(data) > vitals.MAX_BEACON_BYTES or (request.content_length or 0) > vitals.MAX_BEACON_BYTES:
+        abort(413)
+    try:
+        rows = vitals.parse_beacon(data, time.time())
+    except ValueError as e:
+        abort(400, str(e))
+    _vitals.add(rows)
+    return "", 204
+
+# ─── Compiled template ──────────────────────────────────────
+# templates/index.html is compiled once per process, or loaded from the
+# bytecode cache in .build-cache/jinja/app/ (see page_template.py). The dev
+# server restarts when the file changes.
+_template = None
+_template_lock = threading.Lock()
+TEMPLATE_TIMINGS = {"compile_ms": 0.0, "compiles": 0, "render_ms": 0.0, "renders": 0}
+
+def get_template():
+    global _template
+    if _template is None:
+        with _template_lock:
+            if _template is None:
+                t0 = time.perf_counter()
+                _template = page_template.load(app.jinja_env, "app")
+                elapsed = (time.perf_counter() - t0) * 1000
+                TEMPLATE_TIMINGS["compile_ms"] = elapsed
+                TEMPLATE_TIMINGS["compiles"] += 1
+                app.logger.info("Loaded %s in %.1f ms", page_template.NAME, elapsed)
+    return _template
+
+def template_digest():
+    return page_template.source().digest
+
+# ─── Section fragments ──────────────────────────────────────
+# Sections are cached separately, keyed on just the config they read (see
+# fragments.py), so a config edit re-renders only the sections it touches.
+FRAGMENT_CACHE_SIZE = 64
+_fragments = fragments.FragmentCache(FRAGMENT_CACHE_SIZE)
+metrics.REGISTRY.collect(lambda: {(metrics.CACHE_REQUESTS, CACHE_HIT["fragment"]): _fragments.hits,
+                                  (metrics.CACHE_REQUESTS, CACHE_MISS["fragment"]): _fragments.misses})
+
+def render_sections(salt="", **context):
+    # The page as a stream of strings; unchanged sections come from _fragments.
+    # salt is the snapshot's static_salt(): the sections bake in /static URLs
+    src = page_template.source()
+    return fragments.generate(get_template(), context, _fragments, app.jinja_env, src.text, src.digest, salt)
+
+def render_page(salt="", **context):
+    t0 = time.perf_counter()
+    html = externalize_assets("".join(render_sections(salt, **context)))
+    elapsed = (time.perf_counter() - t0) * 1000
+    TEMPLATE_TIMINGS["render_ms"] = elapsed
+    TEMPLATE_TIMINGS["renders"] += 1
+    app.logger.debug("Rendered page in %.1f ms (compile took %.1f ms)",
+                     elapsed, TEMPLATE_TIMINGS["compile_ms"])
+    return html
+
+# ─── External CSS / JS assets ───────────────────────────────
+# Non-critical CSS and the page script are served from content-hashed
+# /assets/ URLs (see assets.externalize_assets) so browsers cache them.
+ASSET_CACHE_SIZE = 32
+_asset_files = OrderedDict()  # name -> {encoding or None: bytes}
+_assets_etag = None  # page_etag() of the last page this process rendered
+
+def externalize_assets(html):
+    html, files = assets.externalize_assets(html, "/assets/")
+    for name, data in files.items():
+        if name not in _asset_files:
+            _asset_files[name] = {None: data}
+            while len(_asset_files) > ASSET_CACHE_SIZE:
+                _asset_files.popitem(last=False)
+    return html
+
+@app.route("/assets/<name>")
+def asset_files(name):
+    global _assets_etag
+    variants = _asset_files.get(name)
+    if variants is None:
+        # Rendered by another worker (or before a restart): render the current
+        # page here too, once, and only for a name that can be one of its files
+        snap = get_snapshot()
+        etag = page_etag(snap)
+        if assets.split_fingerprint(name)[1] is None or etag == _assets_etag:
+            abort(404)
+        render_page(snap.static, **page_context(snap))
+        _assets_etag = etag
+        variants = _asset_files.get(name)
+        if variants is None:
+            abort(404)
+    encoding = negotiate_encoding()
+    body = variants.get(encoding)
+    if body is None:
+        body = variants[encoding] = assets.compress(variants[None], encoding)
+    resp = Response(body, mimetype=mimetypes.guess_type(name)[0])
+    if encoding:
+        resp.content_encoding = encoding
+    resp.vary.add("Accept-Encoding")
+    resp.set_etag(f"{assets.split_fingerprint(name)[1]}-{encoding}" if encoding else assets.split_fingerprint(name)[1])
+    resp.cache_control.public = True
+    resp.cache_control.max_age = IMMUTABLE_MAX_AGE
+    resp.cache_control.immutable = True
+    return resp.make_conditional(request)
+
+def page_context(snap):
+    # Values that are tricky in Jinja2 come precomputed with the config model
+    cfg, model = snap.cfg, snap.model
+    return dict(cfg=cfg, json_data=json.dumps(cfg),
+                total_tech=model.total_tech, project_categories=model.project_categories,
+                project_page_size=projects.PAGE_SIZE, project_image_sizes=projects.IMAGE_SIZES,
+                projects_api="/api/projects",
+                vitals_url="/api/vitals" if app.config["VITALS"] else None, variant=vitals.DEFAULT_VARIANT,
+                live_reload=app.config["LIVE_RELOAD"], page_version=page_etag(snap))
+
+# ─── Rendered page cache ────────────────────────────────────
+# "/" is a pure function of config.json, the template and the static files
+# it references, so the rendered bytes are cached under a hash of all three
+# and reused until one changes.
+CachedPage = namedtuple("CachedPage", "body etag last_modified variants")
+PAGE_CACHE_SIZE = 4
+_page_cache = {}
+
+def page_etag(snap):
+    return hashlib.sha256(f"{snap.digest}:{template_digest()}:{snap.static}".encode()).hexdigest()[:32]
+
+def page_last_modified(snap):
+    return max(snap.mtime_ns / 1e9, page_template.source().mtime)
+
+def store_page(page):
+    global _assets_etag
+    _assets_etag = page.etag  # its /assets/ files are in _asset_files now
+    while len(_page_cache) >= PAGE_CACHE_SIZE:
+        _page_cache.pop(next(iter(_page_cache)), None)
+    _page_cache[page.etag] = page
+    return page
+
+def get_page():
+    snap = get_snapshot()
+    etag = page_etag(snap)
+    page = _page_cache.get(etag)
+    if page is None:
+        with phase("context"):
+            context = page_context(snap)
+        with phase("render"):
+            html = render_page(snap.static, **context)
+        with phase("serialize"):
+            body = html.encode("utf-8")
+        page = store_page(CachedPage(body, etag, page_last_modified(snap), {}))
+    return page
+
+# ─── Streamed rendering (cache misses) ──────────────────────
+# On a miss the page is sent as it renders: <head> first, so the browser
+# can start fetching fonts and stylesheets, then the navbar + hero, then
+# one chunk per section. The assembled bytes land in the page cache.
+app.config.setdefault("STREAM_RENDER", os.environ.get("PORTFOLIO_STREAM", "1") != "0")
+STREAM_FLUSH_MARKERS = ("</head>", "</section>")
+
+def _section_chunks(pieces):
+    buf = []
+    for piece in pieces:
+        buf.append(piece)
+        if any(marker in piece for marker in STREAM_FLUSH_MARKERS):
+            yield "".join(buf)
+            buf.clear()
+    if buf:
+        yield "".join(buf)
+
+def stream_page(snap, etag, encoding):
+    pieces = render_sections(snap.static, **page_context(snap))
+
+    def generate():
+        t0 = time.perf_counter()
+        feed, finish = assets.streaming_compressor(encoding) if encoding else (None, None)
+        parts = []
+        for html in _section_chunks(pieces):
+            data = externalize_assets(html).encode("utf-8")
+            parts.append(data)
+            yield feed(data) if feed else data
+        if finish:
+            yield finish()
+        TEMPLATE_TIMINGS["render_ms"] = (time.perf_counter() - t0) * 1000
+        TEMPLATE_TIMINGS["renders"] += 1
+        store_page(CachedPage(b"".join(parts), etag, page_last_modified(snap), {}))
+    return generate()
+
+# ─── Live reload (Server-Sent Events) ───────────────────────
+# Open pages keep an EventSource on /api/events. When the watcher loads a
+# new config.json, every client gets a "config" event and swaps in the
+# sections that changed. The dev server streams events from a generator (a
+# thread per client); the production server hands these connections to
+# server.EventHub, one selector thread for all of them.
+app.config.setdefault("LIVE_RELOAD", os.environ.get("PORTFOLIO_LIVE_RELOAD", "1") != "0")
+
+class LiveEvents:
+    path = "/api/events"
+    heartbeat = 15  # seconds; a comment line keeps proxies from closing idle streams
+    retry = 1000    # ms before a browser reconnects (e.g. after a dev-server reload)
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.seq, self.last = 0, None
+        self.listeners = []
+
+    @staticmethod
+    def message(event, data):
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+
+    def hello(self):
+        # First message on every connection: the version the client should be at
+        snap = get_snapshot()
+        return f"retry: {self.retry}\n".encode() + self.message(
+            "hello", {"version": snap.version, "etag": page_etag(snap)})
+
+    def publish(self, before, after):
+        changed = sorted(k for k in before.cfg.keys() | after.cfg.keys()
+                         if before.cfg.get(k) != after.cfg.get(k))
+        message = self.message("config", {"version": after.version, "etag": page_etag(after),
+                                          "changed": changed})
+        with self.cond:
+            self.seq, self.last = self.seq + 1, message
+            self.cond.notify_all()
+        for listener in list(self.listeners):
+            listener(message)
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def stream(self):
+        with self.cond:
+            seq = self.seq
+        yield self.hello()
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self.seq != seq, timeout=self.heartbeat)
+                message = self.last if self.seq != seq else b": ping\n\n"
+                seq = self.seq
+            yield message
+
+live_events = LiveEvents()
+
+@app.route(LiveEvents.path)
+def api_events():
+    if not app.config["LIVE_RELOAD"]:
+        abort(404)
+    resp = Response(live_events.stream(), mimetype="text/event-stream")
+    resp.cache_control.no_cache = True
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
+
+# ─── Content negotiation ────────────────────────────────────
+def negotiate_encoding():
+    best, best_q = None, 0
+    for encoding in assets.ENCODINGS:
+        q = request.accept_encodings[encoding]
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+def page_variant(page, encoding):
+    # Compressed bodies are built on first demand and cached with the page
+    body = page.variants.get(encoding)
+    if body is None:
+        body = page.variants[encoding] = assets.compress(page.body, encoding)
+    return body
 
 # ─── Main page ──────────────────────────────────────────────
 @app.route("/")
 def index():
-    cfg = load_config()
-    # Pre-compute values that are tricky in Jinja2
-    total_tech = sum(len(s["items"]) for s in cfg.get("skills", []))
-    project_categories = list(dict.fromkeys(p["category"] for p in cfg.get("projects", [])))
-    return render_template_string(
-        HTML_TEMPLATE, cfg=cfg, json_data=json.dumps(cfg),
-        total_tech=total_tech, project_categories=project_categories
-    )
-
-
-# ═══════════════════════════════════════════════════════════
-#  FULL HTML / CSS / JS TEMPLATE
-# ═══════════════════════════════════════════════════════════
+    with phase("config"):
+        snap = get_snapshot()
+    etag = page_etag(snap)
+    page = _page_cache.get(etag)
+    count_cache("page", page is not None)
+    encoding = negotiate_encoding()
+    tag = f"{etag}-{encoding}" if encoding else etag
+    streamed = False
+    if request.if_none_match.contains_weak(tag):
+        resp = Response(b"", mimetype="text/html")  # make_conditional turns this into a 304
+    elif page is None and app.config["STREAM_RENDER"]:
+        streamed = True
+        with phase("context"):
+            body = stream_page(snap, etag, encoding)
+        if getattr(_timing, "current", None) is not None:
+            _timing.current.note("render", "streamed")  # rendered after the headers have gone out
+        resp = Response(body, mimetype="text/html")
+        resp.headers["X-Accel-Buffering"] = "no"  # keep reverse proxies from buffering
+        resp.implicit_sequence_conversion = False  # or make_conditional() buffers the stream
+    else:
+        page = page or get_page()
+        with phase("serialize"):
+            body = page_variant(page, encoding) if encoding else page.body
+        resp = Response(body, mimetype="text/html")
+    if encoding:
+        resp.content_encoding = encoding
+    # Streamed compressed bytes differ from the cached max-compression ones, hence weak
+    resp.set_etag(tag, weak=streamed and bool(encoding))
+    resp.vary.add("Accept-Encoding")
+    resp.last_modified = page_last_modified(snap)
+    resp.cache_control.public = True
+    resp.cache_control.no_cache = True  # always revalidate; a 304 costs nothing
+    return resp.make_conditional(request)
 
-HTML_TEMPLATE = r"""
-<!DOCTYPE html>
-<html lang="en" data-theme="dark">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ cfg.meta.title }}</title>
-    <link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>{{ cfg.meta.favicon }}</text></svg>">
-    <link href="https://fonts.googleapis.com/css2?family={{ cfg.theme.font_heading }}:wght@300;400;500;600;700;800;900&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css">
-    <style>
-        /* ════════════════ CSS VARIABLES (from config) ════════════════ */
-        :root {
-            --primary: {{ cfg.theme.primary_color }};
-            --secondary: {{ cfg.theme.secondary_color }};
-            --accent: {{ cfg.theme.accent_color }};
-            --dark-bg: {{ cfg.theme.dark_bg }};
-            --card-bg: {{ cfg.theme.card_bg }};
-            --text: {{ cfg.theme.text_color }};
-            --heading: {{ cfg.theme.heading_color }};
-            --grad-start: {{ cfg.theme.gradient_start }};
-            --grad-end: {{ cfg.theme.gradient_end }};
-            --font: '{{ cfg.theme.font_heading }}', system-ui, -apple-system, sans-serif;
-            --radius: 16px;
-            --transition: all 0.4s cubic-bezier(0.25, 0.46, 0.45, 0.94);
-        }
-
-        /* ════════════════ RESET & BASE ════════════════ */
-        *, *::before, *::after { margin:0; padding:0; box-sizing:border-box; }
-        html { scroll-behavior: smooth; scroll-padding-top: 80px; }
-        body {
-            font-family: var(--font);
-            background: var(--dark-bg);
-            color: var(--text);
-            line-height: 1.7;
-            overflow-x: hidden;
-            -webkit-font-smoothing: antialiased;
-        }
-        ::selection { background: var(--primary); color: #fff; }
-        a { color: inherit; text-decoration: none; }
-        img { max-width: 100%; display: block; }
-
-        /* ════════════════ ANIMATED BACKGROUND ════════════════ */
-        .bg-grid {
-            position: fixed; inset: 0; z-index: -2;
-            background-image:
-                radial-gradient(circle at 1px 1px, rgba(255,255,255,0.03) 1px, transparent 0);
-            background-size: 40px 40px;
-        }
-        .bg-glow {
-            position: fixed; z-index: -1; border-radius: 50%;
-            filter: blur(120px); opacity: 0.15; pointer-events: none;
-        }
-        .bg-glow-1 { width:600px; height:600px; top:-100px; left:-100px; background:var(--primary); animation: float 20s ease-in-out infinite; }
-        .bg-glow-2 { width:500px; height:500px; bottom:-50px; right:-100px; background:var(--secondary); animation: float 25s ease-in-out infinite reverse; }
-        .bg-glow-3 { width:400px; height:400px; top:50%; left:50%; transform:translate(-50%,-50%); background:var(--accent); animation: float 30s ease-in-out infinite; }
-        @keyframes float {
-            0%,100% { transform: translate(0,0) scale(1); }
-            25% { transform: translate(30px,-40px) scale(1.05); }
-            50% { transform: translate(-20px,30px) scale(0.95); }
-            75% { transform: translate(40px,20px) scale(1.03); }
-        }
-
-        /* ════════════════ CURSOR FOLLOWER ════════════════ */
-        .cursor-glow {
-            position: fixed; width:300px; height:300px; border-radius:50%;
-            background: radial-gradient(circle, rgba(108,99,255,0.08), transparent 70%);
-            pointer-events:none; z-index:0; transition: transform 0.15s ease-out;
-            transform: translate(-50%,-50%);
-        }
-
-        /* ════════════════ NAVBAR ════════════════ */
-        .navbar {
-            position: fixed; top:0; left:0; right:0; z-index:1000;
-            padding: 0 40px; height: 72px;
-            display: flex; align-items: center; justify-content: space-between;
-            background: rgba(10,10,26,0.7);
-            backdrop-filter: blur(20px) saturate(180%);
-            border-bottom: 1px solid rgba(255,255,255,0.06);
-            transition: var(--transition);
-        }
-        .navbar.scrolled { background: rgba(10,10,26,0.95); box-shadow: 0 4px 30px rgba(0,0,0,0.3); }
-        .nav-logo {
-            font-size: 1.4rem; font-weight: 800;
-            background: linear-gradient(135deg, var(--grad-start), var(--grad-end));
-            -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-            letter-spacing: -0.5px;
-        }
-        .nav-links { display:flex; gap:8px; align-items:center; }
-        .nav-links a {
-            padding: 8px 16px; border-radius: 8px; font-size: 0.88rem;
-            font-weight: 500; color: var(--text); transition: var(--transition);
-            position: relative;
-        }
-        .nav-links a:hover, .nav-links a.active {
-            color: var(--primary); background: rgba(108,99,255,0.1);
-        }
-        .nav-cta {
-            background: linear-gradient(135deg, var(--grad-start), var(--grad-end)) !important;
-            color: #fff !important; font-weight: 600 !important;
-            padding: 10px 24px !important; border-radius: 10px !important;
-            box-shadow: 0 4px 15px rgba(108,99,255,0.3);
-        }
-        .nav-cta:hover { transform: translateY(-2px); box-shadow: 0 6px 25px rgba(108,99,255,0.4); }
-        .hamburger { display:none; flex-direction:column; gap:5px; cursor:pointer; padding:10px; }
-        .hamburger span { width:24px; height:2px; background:var(--text); transition:var(--transition); border-radius:2px; }
-        .hamburger.active span:nth-child(1) { transform: rotate(45deg) translate(5px,5px); }
-        .hamburger.active span:nth-child(2) { opacity:0; }
-        .hamburger.active span:nth-child(3) { transform: rotate(-45deg) translate(5px,-5px); }
-
-        /* ════════════════ HERO ════════════════ */
-        .hero {
-            min-height: 100vh; display: flex; align-items: center;
-            padding: 120px 40px 80px;
-            position: relative;
-        }
-        .hero-content { max-width: 1200px; margin: 0 auto; width: 100%; }
-        .hero-badge {
-            display: inline-flex; align-items: center; gap: 8px;
-            padding: 8px 20px; border-radius: 50px;
-            background: rgba(108,99,255,0.1); border: 1px solid rgba(108,99,255,0.2);
-            font-size: 0.85rem; font-weight: 500; color: var(--primary);
-            margin-bottom: 24px; animation: fadeInUp 0.8s ease;
-        }
-        .hero-badge .pulse { width:8px; height:8px; border-radius:50%; background:#4ade80; animation: pulse 2s ease-in-out infinite; }
-        @keyframes pulse { 0%,100%{ opacity:1; transform:scale(1); } 50%{ opacity:0.5; transform:scale(1.5); }}
-        .hero h1 {
-            font-size: clamp(2.8rem, 6vw, 5rem); font-weight: 800;
-            line-height: 1.1; color: var(--heading);
-            margin-bottom: 8px; letter-spacing: -2px;
-            animation: fadeInUp 0.8s ease 0.1s both;
-        }
-        .hero .gradient-text {
-            background: linear-gradient(135deg, var(--grad-start), var(--grad-end), var(--secondary));
-            background-size: 200% 200%; animation: gradientShift 5s ease infinite;
-            -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-        }
-        @keyframes gradientShift { 0%{background-position:0% 50%} 50%{background-position:100% 50%} 100%{background-position:0% 50%} }
-        .hero-subtitle {
-            font-size: clamp(1rem,2vw,1.25rem); color: var(--text);
-            max-width: 600px; margin: 20px 0 36px; opacity: 0.8;
-            animation: fadeInUp 0.8s ease 0.2s both;
-        }
-        .hero-actions {
-            display: flex; gap: 16px; flex-wrap: wrap;
-            animation: fadeInUp 0.8s ease 0.3s both;
-        }
-        .btn {
-            padding: 14px 32px; border-radius: 12px; font-size: 0.95rem;
-            font-weight: 600; cursor: pointer; border: none;
-            display: inline-flex; align-items: center; gap: 10px;
-            transition: var(--transition); font-family: var(--font);
-        }
-        .btn-primary {
-            background: linear-gradient(135deg, var(--grad-start), var(--grad-end));
-            color: #fff; box-shadow: 0 4px 20px rgba(108,99,255,0.3);
-        }
-        .btn-primary:hover { transform: translateY(-3px); box-shadow: 0 8px 30px rgba(108,99,255,0.45); }
-        .btn-outline {
-            background: transparent; color: var(--text);
-            border: 1.5px solid rgba(255,255,255,0.15);
-        }
-        .btn-outline:hover { border-color: var(--primary); color: var(--primary); background: rgba(108,99,255,0.05); }
-        .hero-stats {
-            display: flex; gap: 48px; margin-top: 60px;
-            animation: fadeInUp 0.8s ease 0.4s both;
-        }
-        .stat-item { text-align: left; }
-        .stat-number {
-            font-size: 2rem; font-weight: 800; color: var(--heading);
-            background: linear-gradient(135deg, var(--grad-start), var(--grad-end));
-            -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-        }
-        .stat-label { font-size: 0.85rem; color: var(--text); opacity: 0.6; margin-top: 4px; }
-        .hero-scroll {
-            position: absolute; bottom: 40px; left: 50%; transform: translateX(-50%);
-            display: flex; flex-direction: column; align-items: center; gap: 8px;
-            color: var(--text); opacity: 0.4; font-size: 0.8rem;
-            animation: bounce 2s ease-in-out infinite;
-        }
-        @keyframes bounce { 0%,100%{transform:translateX(-50%) translateY(0)} 50%{transform:translateX(-50%) translateY(10px)} }
-
-        /* ════════════════ SECTIONS ════════════════ */
-        section { padding: 100px 40px; max-width: 1200px; margin: 0 auto; }
-        .section-header { text-align:center; margin-bottom:64px; }
-        .section-label {
-            display: inline-block; padding: 6px 16px; border-radius: 50px;
-            background: rgba(108,99,255,0.1); border: 1px solid rgba(108,99,255,0.15);
-            font-size: 0.8rem; font-weight: 600; color: var(--primary);
-            text-transform: uppercase; letter-spacing: 2px; margin-bottom: 16px;
-        }
-        .section-title {
-            font-size: clamp(2rem,4vw,2.8rem); font-weight: 800;
-            color: var(--heading); letter-spacing: -1px; margin-bottom: 16px;
-        }
-        .section-desc { color: var(--text); opacity:0.7; max-width:600px; margin:0 auto; font-size:1.05rem; }
-
-        /* ════════════════ ABOUT ════════════════ */
-        .about-grid { display:grid; grid-template-columns:1fr 1fr; gap:64px; align-items:center; }
-        .about-image-wrapper {
-            position:relative; display:flex; justify-content:center; align-items:center;
-        }
-        .about-image-frame {
-            width:350px; height:350px; border-radius: 24px; overflow:hidden;
-            border: 2px solid rgba(108,99,255,0.2);
-            background: linear-gradient(135deg, rgba(108,99,255,0.1), rgba(0,210,255,0.1));
-            display:flex; align-items:center; justify-content:center;
-            position:relative;
-        }
-        .about-image-frame::before {
-            content:''; position:absolute; inset:-2px; border-radius:26px;
-            background: linear-gradient(135deg, var(--grad-start), var(--grad-end));
-            z-index:-1; opacity:0.5;
-        }
-        .about-image-placeholder {
-            font-size: 8rem; opacity: 0.3;
-        }
-        .about-image-frame img { width:100%; height:100%; object-fit:cover; }
-        .about-text h3 { font-size:1.6rem; font-weight:700; color:var(--heading); margin-bottom:20px; }
-        .about-text p { margin-bottom:24px; opacity:0.8; font-size:1.05rem; }
-        .about-tags { display:flex; flex-wrap:wrap; gap:10px; margin-top:24px; }
-        .about-tag {
-            padding:6px 16px; border-radius:50px;
-            background:rgba(108,99,255,0.08); border:1px solid rgba(108,99,255,0.15);
-            font-size:0.82rem; font-weight:500; color:var(--primary);
-        }
-
-        /* ════════════════ SKILLS ════════════════ */
-        .skills-grid { display:grid; grid-template-columns:repeat(auto-fit,minmax(340px,1fr)); gap:24px; }
-        .skill-card {
-            padding:32px; border-radius:var(--radius);
-            background: var(--card-bg);
-            border:1px solid rgba(255,255,255,0.06);
-            backdrop-filter:blur(10px);
-            transition: var(--transition);
-        }
-        .skill-card:hover {
-            border-color:rgba(108,99,255,0.2);
-            transform:translateY(-4px);
-            box-shadow: 0 20px 40px rgba(0,0,0,0.2);
-        }
-        .skill-card-header { display:flex; align-items:center; gap:12px; margin-bottom:24px; }
-        .skill-card-icon { font-size:1.8rem; }
-        .skill-card-title { font-size:1.1rem; font-weight:700; color:var(--heading); }
-        .skill-item { margin-bottom:16px; }
-        .skill-info { display:flex; justify-content:space-between; margin-bottom:6px; }
-        .skill-name { font-size:0.9rem; font-weight:500; }
-        .skill-pct { font-size:0.82rem; color:var(--primary); font-weight:600; }
-        .skill-bar { height:6px; border-radius:3px; background:rgba(255,255,255,0.06); overflow:hidden; }
-        .skill-fill {
-            height:100%; border-radius:3px;
-            background:linear-gradient(90deg,var(--grad-start),var(--grad-end));
-            width:0%; transition: width 1.5s cubic-bezier(0.25,0.46,0.45,0.94);
-        }
-
-        /* ════════════════ EXPERIENCE ════════════════ */
-        .timeline { position:relative; padding-left:40px; }
-        .timeline::before {
-            content:''; position:absolute; left:15px; top:0; bottom:0; width:2px;
-            background:linear-gradient(180deg,var(--primary),var(--accent),transparent);
-        }
-        .timeline-item {
-            position:relative; margin-bottom:48px;
-            padding:32px; border-radius:var(--radius);
-            background:var(--card-bg); border:1px solid rgba(255,255,255,0.06);
-            backdrop-filter:blur(10px); transition:var(--transition);
-        }
-        .timeline-item:hover { border-color:rgba(108,99,255,0.2); transform:translateX(8px); }
-        .timeline-dot {
-            position:absolute; left:-33px; top:38px; width:12px; height:12px;
-            border-radius:50%; background:var(--primary);
-            border:3px solid var(--dark-bg);
-            box-shadow: 0 0 0 3px rgba(108,99,255,0.3);
-        }
-        .timeline-header { display:flex; justify-content:space-between; align-items:flex-start; flex-wrap:wrap; gap:12px; margin-bottom:16px; }
-        .timeline-company { font-size:1.2rem; font-weight:700; color:var(--heading); }
-        .timeline-role { font-size:0.95rem; color:var(--primary); font-weight:500; margin-top:4px; }
-        .timeline-meta { text-align:right; }
-        .timeline-duration { font-size:0.85rem; opacity:0.7; }
-        .timeline-location { font-size:0.82rem; opacity:0.5; }
-        .timeline-type {
-            display:inline-block; padding:3px 10px; border-radius:50px;
-            background:rgba(108,99,255,0.1); font-size:0.75rem; color:var(--primary);
-            font-weight:500; margin-top:4px;
-        }
-        .timeline-desc { list-style:none; padding:0; margin: 12px 0; }
-        .timeline-desc li {
-            padding: 6px 0 6px 20px; position:relative; font-size:0.92rem; opacity:0.8;
-        }
-        .timeline-desc li::before {
-            content:'▹'; position:absolute; left:0; color:var(--primary); font-weight:700;
-        }
-        .timeline-tech { display:flex; flex-wrap:wrap; gap:8px; margin-top:16px; }
-        .timeline-tech span {
-            padding:4px 12px; border-radius:6px; font-size:0.78rem;
-            background:rgba(108,99,255,0.08); color:var(--primary); font-weight:500;
-        }
-
-        /* ════════════════ PROJECTS ════════════════ */
-        .project-filters {
-            display:flex; justify-content:center; gap:8px; margin-bottom:48px; flex-wrap:wrap;
-        }
-        .filter-btn {
-            padding:8px 20px; border-radius:50px; border:1px solid rgba(255,255,255,0.1);
-            background:transparent; color:var(--text); font-size:0.85rem;
-            font-weight:500; cursor:pointer; transition:var(--transition); font-family:var(--font);
-        }
-        .filter-btn.active, .filter-btn:hover {
-            background:var(--primary); color:#fff; border-color:var(--primary);
-        }
-        .projects-grid { display:grid; grid-template-columns:repeat(auto-fit,minmax(360px,1fr)); gap:24px; }
-        .project-card {
-            border-radius:var(--radius); overflow:hidden;
-            background:var(--card-bg); border:1px solid rgba(255,255,255,0.06);
-            backdrop-filter:blur(10px); transition:var(--transition);
-            display:flex; flex-direction:column;
-        }
-        .project-card:hover {
-            border-color:rgba(108,99,255,0.2); transform:translateY(-6px);
-            box-shadow: 0 25px 50px rgba(0,0,0,0.3);
-        }
-        .project-image {
-            height:200px; position:relative; overflow:hidden;
-            background:linear-gradient(135deg, rgba(108,99,255,0.15), rgba(0,210,255,0.15));
-            display:flex; align-items:center; justify-content:center;
-        }
-        .project-image img { width:100%; height:100%; object-fit:cover; }
-        .project-image-placeholder { font-size:3rem; opacity:0.3; }
-        .featured-badge {
-            position:absolute; top:12px; right:12px; padding:4px 12px;
-            border-radius:50px; background:var(--secondary); color:#fff;
-            font-size:0.72rem; font-weight:600; text-transform:uppercase; letter-spacing:1px;
-        }
-        .project-body { padding:28px; flex:1; display:flex; flex-direction:column; }
-        .project-category { font-size:0.78rem; color:var(--primary); font-weight:600; text-transform:uppercase; letter-spacing:1px; margin-bottom:8px; }
-        .project-title { font-size:1.2rem; font-weight:700; color:var(--heading); margin-bottom:12px; }
-        .project-desc { font-size:0.9rem; opacity:0.7; margin-bottom:20px; flex:1; }
-        .project-tech { display:flex; flex-wrap:wrap; gap:6px; margin-bottom:20px; }
-        .project-tech span {
-            padding:3px 10px; border-radius:6px; font-size:0.75rem;
-            background:rgba(108,99,255,0.08); color:var(--primary); font-weight:500;
-        }
-        .project-links { display:flex; gap:12px; }
-        .project-link {
-            padding:8px 18px; border-radius:8px; font-size:0.82rem;
-            font-weight:500; transition:var(--transition);
-            display:inline-flex; align-items:center; gap:6px;
-        }
-        .project-link-code { background:rgba(255,255,255,0.06); color:var(--text); }
-        .project-link-code:hover { background:rgba(108,99,255,0.15); color:var(--primary); }
-        .project-link-live {
-            background:linear-gradient(135deg,var(--grad-start),var(--grad-end)); color:#fff;
-        }
-        .project-link-live:hover { transform:translateY(-2px); box-shadow:0 4px 15px rgba(108,99,255,0.3); }
-
-        /* ════════════════ EDUCATION ════════════════ */
-        .edu-card {
-            padding:40px; border-radius:var(--radius);
-            background:var(--card-bg); border:1px solid rgba(255,255,255,0.06);
-            backdrop-filter:blur(10px); max-width:800px; margin:0 auto;
-        }
-        .edu-header { margin-bottom:24px; }
-        .edu-institution { font-size:1.4rem; font-weight:700; color:var(--heading); }
-        .edu-degree { font-size:1rem; color:var(--primary); margin-top:4px; }
-        .edu-meta { display:flex; gap:20px; margin-top:8px; font-size:0.88rem; opacity:0.6; }
-        .edu-section-title { font-size:0.9rem; font-weight:600; color:var(--heading); margin:20px 0 12px; text-transform:uppercase; letter-spacing:1px; }
-        .edu-list { display:flex; flex-wrap:wrap; gap:8px; }
-        .edu-chip {
-            padding:5px 14px; border-radius:8px;
-            background:rgba(108,99,255,0.08); font-size:0.82rem; color:var(--primary); font-weight:500;
-        }
-        .edu-achievement {
-            padding:8px 0 8px 20px; position:relative; font-size:0.9rem; opacity:0.8;
-        }
-        .edu-achievement::before { content:'▹'; position:absolute; left:0; color:var(--primary); font-weight:700; }
-
-        /* ════════════════ CERTIFICATIONS ════════════════ */
-        .cert-grid { display:grid; grid-template-columns:repeat(auto-fit,minmax(280px,1fr)); gap:20px; margin-top:48px; }
-        .cert-card {
-            padding:24px; border-radius:var(--radius);
-            background:var(--card-bg); border:1px solid rgba(255,255,255,0.06);
-            backdrop-filter:blur(10px); transition:var(--transition);
-            text-align:center;
-        }
-        .cert-card:hover { border-color:rgba(108,99,255,0.2); transform:translateY(-4px); }
-        .cert-icon { font-size:2.5rem; margin-bottom:12px; }
-        .cert-name { font-size:1rem; font-weight:600; color:var(--heading); margin-bottom:4px; }
-        .cert-issuer { font-size:0.85rem; opacity:0.6; margin-bottom:4px; }
-        .cert-date { font-size:0.8rem; color:var(--primary); font-weight:500; }
-
-        /* ════════════════ ACHIEVEMENTS ════════════════ */
-        .achieve-grid { display:grid; grid-template-columns:repeat(auto-fit,minmax(250px,1fr)); gap:20px; }
-        .achieve-card {
-            padding:28px; border-radius:var(--radius); text-align:center;
-            background:var(--card-bg); border:1px solid rgba(255,255,255,0.06);
-            backdrop-filter:blur(10px); transition:var(--transition);
-        }
-        .achieve-card:hover { border-color:rgba(108,99,255,0.2); transform:translateY(-4px); }
-        .achieve-icon { font-size:2.5rem; margin-bottom:12px; }
-        .achieve-title { font-size:1rem; font-weight:600; color:var(--heading); margin-bottom:8px; }
-        .achieve-desc { font-size:0.88rem; opacity:0.6; }
-
-        /* ════════════════ TESTIMONIALS ════════════════ */
-        .testimonials-grid { display:grid; grid-template-columns:repeat(auto-fit,minmax(400px,1fr)); gap:24px; }
-        .testimonial-card {
-            padding:36px; border-radius:var(--radius);
-            background:var(--card-bg); border:1px solid rgba(255,255,255,0.06);
-            backdrop-filter:blur(10px); transition:var(--transition);
-            position:relative;
-        }
-        .testimonial-card:hover { border-color:rgba(108,99,255,0.2); }
-        .testimonial-quote { font-size:3rem; color:var(--primary); opacity:0.3; position:absolute; top:16px; left:24px; line-height:1; font-family:Georgia,serif; }
-        .testimonial-text { font-size:1rem; opacity:0.8; margin-bottom:20px; padding-top:20px; font-style:italic; }
-        .testimonial-author { display:flex; align-items:center; gap:12px; }
-        .testimonial-avatar {
-            width:48px; height:48px; border-radius:50%;
-            background:linear-gradient(135deg,var(--grad-start),var(--grad-end));
-            display:flex; align-items:center; justify-content:center;
-            font-size:1.2rem; color:#fff; font-weight:600;
-        }
-        .testimonial-name { font-size:0.95rem; font-weight:600; color:var(--heading); }
-        .testimonial-role { font-size:0.82rem; opacity:0.6; }
-
-        /* ════════════════ CONTACT ════════════════ */
-        .contact-content { max-width:700px; margin:0 auto; text-align:center; }
-        .contact-content h2 { font-size:2.4rem; font-weight:800; color:var(--heading); margin-bottom:16px; }
-        .contact-content p { font-size:1.05rem; opacity:0.7; margin-bottom:40px; }
-        .contact-links { display:flex; flex-wrap:wrap; justify-content:center; gap:16px; margin-bottom:40px; }
-        .contact-link {
-            display:flex; align-items:center; gap:10px;
-            padding:14px 28px; border-radius:12px;
-            background:var(--card-bg); border:1px solid rgba(255,255,255,0.06);
-            backdrop-filter:blur(10px); transition:var(--transition);
-            font-size:0.92rem;
-        }
-        .contact-link:hover { border-color:var(--primary); transform:translateY(-3px); }
-        .contact-link i { color:var(--primary); font-size:1.1rem; }
-        .social-links { display:flex; justify-content:center; gap:16px; }
-        .social-link {
-            width:52px; height:52px; border-radius:14px;
-            background:var(--card-bg); border:1px solid rgba(255,255,255,0.06);
-            display:flex; align-items:center; justify-content:center;
-            font-size:1.3rem; color:var(--text); transition:var(--transition);
-        }
-        .social-link:hover {
-            background:var(--primary); color:#fff; border-color:var(--primary);
-            transform:translateY(-4px); box-shadow:0 8px 25px rgba(108,99,255,0.3);
-        }
-
-        /* ════════════════ FOOTER ════════════════ */
-        footer {
-            text-align:center; padding:40px;
-            border-top:1px solid rgba(255,255,255,0.06);
-            font-size:0.85rem; opacity:0.5;
-        }
-
-        /* ════════════════ SCROLL REVEAL ════════════════ */
-        .reveal { opacity:0; transform:translateY(30px); transition: all 0.8s cubic-bezier(0.25,0.46,0.45,0.94); }
-        .reveal.visible { opacity:1; transform:translateY(0); }
-
-        /* ════════════════ RESPONSIVE ════════════════ */
-        @media (max-width:900px) {
-            .navbar { padding:0 20px; }
-            .nav-links {
-                position:fixed; top:72px; left:0; right:0; bottom:0;
-                background:rgba(10,10,26,0.98); flex-direction:column;
-                padding:40px 20px; gap:8px;
-                transform:translateX(100%); transition:var(--transition);
-            }
-            .nav-links.open { transform:translateX(0); }
-            .hamburger { display:flex; }
-            section { padding:60px 20px; }
-            .hero { padding:100px 20px 60px; }
-            .hero-stats { gap:24px; flex-wrap:wrap; }
-            .about-grid { grid-template-columns:1fr; gap:40px; }
-            .about-image-wrapper { order:-1; }
-            .skills-grid { grid-template-columns:1fr; }
-            .projects-grid { grid-template-columns:1fr; }
-            .testimonials-grid { grid-template-columns:1fr; }
-            .timeline { padding-left:30px; }
-        }
-        @media (max-width:480px) {
-            .hero h1 { font-size:2.2rem; letter-spacing:-1px; }
-            .hero-actions { flex-direction:column; }
-            .btn { width:100%; justify-content:center; }
-            .contact-links { flex-direction:column; }
-        }
-
-        /* ════════════════ ANIMATIONS ════════════════ */
-        @keyframes fadeInUp { from{opacity:0;transform:translateY(30px)} to{opacity:1;transform:translateY(0)} }
-        @keyframes fadeInLeft { from{opacity:0;transform:translateX(-30px)} to{opacity:1;transform:translateX(0)} }
-        @keyframes fadeInRight { from{opacity:0;transform:translateX(30px)} to{opacity:1;transform:translateX(0)} }
-        .delay-1 { animation-delay:0.1s; }
-        .delay-2 { animation-delay:0.2s; }
-        .delay-3 { animation-delay:0.3s; }
-        .delay-4 { animation-delay:0.4s; }
-
-        /* ════════════════ TYPING ANIMATION ════════════════ */
-        .typing-container { display:inline; }
-        .typing-text { border-right:2px solid var(--primary); padding-right:4px; animation: blink 1s step-end infinite; }
-        @keyframes blink { 50%{border-color:transparent} }
-    </style>
-</head>
-<body>
-    <!-- Background effects -->
-    <div class="bg-grid"></div>
-    <div class="bg-glow bg-glow-1"></div>
-    <div class="bg-glow bg-glow-2"></div>
-    <div class="bg-glow bg-glow-3"></div>
-    <div class="cursor-glow" id="cursorGlow"></div>
-
-    <!-- ═══════ NAVBAR ═══════ -->
-    <nav class="navbar" id="navbar">
-        <a href="#" class="nav-logo">&lt;{{ cfg.personal.name.split()[0] }} /&gt;</a>
-        <div class="nav-links" id="navLinks">
-            <a href="#about">About</a>
-            <a href="#skills">Skills</a>
-            <a href="#experience">Experience</a>
-            <a href="#projects">Projects</a>
-            <a href="#education">Education</a>
-            <a href="#contact" class="nav-cta">Contact</a>
-        </div>
-        <div class="hamburger" id="hamburger" onclick="toggleMenu()">
-            <span></span><span></span><span></span>
-        </div>
-    </nav>
-
-    <!-- ═══════ HERO ═══════ -->
-    <section class="hero" id="hero">
-        <div class="hero-content">
-            {% if cfg.personal.available_for_hire %}
-            <div class="hero-badge">
-                <span class="pulse"></span> Available for opportunities
-            </div>
-            {% endif %}
-            <h1>Hi, I'm <span class="gradient-text">{{ cfg.personal.name }}</span></h1>
-            <h1 style="font-size:clamp(1.5rem,3vw,2.5rem);font-weight:600;color:var(--text);opacity:0.7;animation:fadeInUp 0.8s ease 0.15s both;">
-                <span class="typing-container"><span class="typing-text" id="typingText"></span></span>
-            </h1>
-            <p class="hero-subtitle">{{ cfg.personal.tagline }}</p>
-            <div class="hero-actions">
-                <a href="#projects" class="btn btn-primary">
-                    <i class="fas fa-rocket"></i> View My Work
-                </a>
-                <a href="{{ cfg.personal.resume_link }}" class="btn btn-outline" target="_blank">
-                    <i class="fas fa-download"></i> Download Resume
-                </a>
-                <a href="#contact" class="btn btn-outline">
-                    <i class="fas fa-paper-plane"></i> Get in Touch
-                </a>
-            </div>
-            <div class="hero-stats">
-                <div class="stat-item">
-                    <div class="stat-number" data-count="{{ cfg.experience|length }}">0+</div>
-                    <div class="stat-label">Years Experience</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number" data-count="{{ cfg.projects|length }}">0+</div>
-                    <div class="stat-label">Projects Built</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number" data-count="{{ total_tech }}">0+</div>
-                    <div class="stat-label">Technologies</div>
-                </div>
-            </div>
-        </div>
-        <div class="hero-scroll">
-            <span>Scroll Down</span>
-            <i class="fas fa-chevron-down"></i>
-        </div>
-    </section>
-
-    <!-- ═══════ ABOUT ═══════ -->
-    <section id="about">
-        <div class="section-header reveal">
-            <span class="section-label">About Me</span>
-            <h2 class="section-title">Get to know me</h2>
-        </div>
-        <div class="about-grid">
-            <div class="about-image-wrapper reveal">
-                <div class="about-image-frame">
-                    {% if cfg.personal.profile_image %}
-                    <img src="{{ cfg.personal.profile_image }}" alt="{{ cfg.personal.name }}">
-                    {% else %}
-                    <div class="about-image-placeholder">👨‍💻</div>
-                    {% endif %}
-                </div>
-            </div>
-            <div class="about-text reveal">
-                <h3>A passionate engineer who loves building things</h3>
-                <p>{{ cfg.personal.bio }}</p>
-                <div class="about-tags">
-                    <span class="about-tag">🎯 Problem Solver</span>
-                    <span class="about-tag">🚀 Fast Learner</span>
-                    <span class="about-tag">🤝 Team Player</span>
-                    <span class="about-tag">📐 Clean Code Advocate</span>
-                    <span class="about-tag">🌍 Open Source Enthusiast</span>
-                </div>
-            </div>
-        </div>
-    </section>
-
-    <!-- ═══════ SKILLS ═══════ -->
-    <section id="skills">
-        <div class="section-header reveal">
-            <span class="section-label">Skills</span>
-            <h2 class="section-title">Technologies I work with</h2>
-            <p class="section-desc">Crafting solutions with the right tools for each challenge</p>
-        </div>
-        <div class="skills-grid">
-            {% for skill_group in cfg.skills %}
-            <div class="skill-card reveal">
-                <div class="skill-card-header">
-                    <span class="skill-card-icon">{{ skill_group.icon }}</span>
-                    <span class="skill-card-title">{{ skill_group.category }}</span>
-                </div>
-                {% for item in skill_group['items'] %}
-                <div class="skill-item">
-                    <div class="skill-info">
-                        <span class="skill-name">{{ item.name }}</span>
-                        <span class="skill-pct">{{ item.level }}%</span>
-                    </div>
-                    <div class="skill-bar">
-                        <div class="skill-fill" data-width="{{ item.level }}"></div>
-                    </div>
-                </div>
-                {% endfor %}
-            </div>
-            {% endfor %}
-        </div>
-    </section>
-
-    <!-- ═══════ EXPERIENCE ═══════ -->
-    <section id="experience">
-        <div class="section-header reveal">
-            <span class="section-label">Experience</span>
-            <h2 class="section-title">Where I've worked</h2>
-            <p class="section-desc">My professional journey and contributions</p>
-        </div>
-        <div class="timeline">
-            {% for exp in cfg.experience %}
-            <div class="timeline-item reveal">
-                <div class="timeline-dot"></div>
-                <div class="timeline-header">
-                    <div>
-                        <div class="timeline-company">{{ exp.company }}</div>
-                        <div class="timeline-role">{{ exp.role }}</div>
-                    </div>
-                    <div class="timeline-meta">
-                        <div class="timeline-duration">{{ exp.duration }}</div>
-                        <div class="timeline-location">📍 {{ exp.location }}</div>
-                        <span class="timeline-type">{{ exp.type }}</span>
-                    </div>
-                </div>
-                <ul class="timeline-desc">
-                    {% for point in exp.description %}
-                    <li>{{ point }}</li>
-                    {% endfor %}
-                </ul>
-                <div class="timeline-tech">
-                    {% for t in exp.tech %}
-                    <span>{{ t }}</span>
-                    {% endfor %}
-                </div>
-            </div>
-            {% endfor %}
-        </div>
-    </section>
-
-    <!-- ═══════ PROJECTS ═══════ -->
-    <section id="projects">
-        <div class="section-header reveal">
-            <span class="section-label">Projects</span>
-            <h2 class="section-title">Things I've built</h2>
-            <p class="section-desc">A selection of projects that showcase my skills</p>
-        </div>
-        <div class="project-filters reveal">
-            <button class="filter-btn active" onclick="filterProjects('all')">All</button>
-            {% for cat in project_categories %}
-            <button class="filter-btn" onclick="filterProjects('{{ cat }}')">{{ cat }}</button>
-            {% endfor %}
-        </div>
-        <div class="projects-grid" id="projectsGrid">
-            {% for proj in cfg.projects %}
-            <div class="project-card reveal" data-category="{{ proj.category }}">
-                <div class="project-image">
-                    {% if proj.image %}
-                    <img src="{{ proj.image }}" alt="{{ proj.title }}">
-                    {% else %}
-                    <div class="project-image-placeholder">🔧</div>
-                    {% endif %}
-                    {% if proj.featured %}
-                    <span class="featured-badge">⭐ Featured</span>
-                    {% endif %}
-                </div>
-                <div class="project-body">
-                    <div class="project-category">{{ proj.category }}</div>
-                    <div class="project-title">{{ proj.title }}</div>
-                    <div class="project-desc">{{ proj.description }}</div>
-                    <div class="project-tech">
-                        {% for t in proj.tech %}
-                        <span>{{ t }}</span>
-                        {% endfor %}
-                    </div>
-                    <div class="project-links">
-                        {% if proj.github %}
-                        <a href="{{ proj.github }}" class="project-link project-link-code" target="_blank">
-                            <i class="fab fa-github"></i> Code
-                        </a>
-                        {% endif %}
-                        {% if proj.live %}
-                        <a href="{{ proj.live }}" class="project-link project-link-live" target="_blank">
-                            <i class="fas fa-external-link-alt"></i> Live
-                        </a>
-                        {% endif %}
-                    </div>
-                </div>
-            </div>
-            {% endfor %}
-        </div>
-    </section>
-
-    <!-- ═══════ EDUCATION & CERTS ═══════ -->
-    <section id="education">
-        <div class="section-header reveal">
-            <span class="section-label">Education</span>
-            <h2 class="section-title">Academic Background</h2>
-        </div>
-        {% for edu in cfg.education %}
-        <div class="edu-card reveal">
-            <div class="edu-header">
-                <div class="edu-institution">🎓 {{ edu.institution }}</div>
-                <div class="edu-degree">{{ edu.degree }}</div>
-                <div class="edu-meta">
-                    <span>📅 {{ edu.duration }}</span>
-                    <span>📊 GPA: {{ edu.gpa }}</span>
-                </div>
-            </div>
-            {% if edu.coursework %}
-            <div class="edu-section-title">Key Coursework</div>
-            <div class="edu-list">
-                {% for course in edu.coursework %}
-                <span class="edu-chip">{{ course }}</span>
-                {% endfor %}
-            </div>
-            {% endif %}
-            {% if edu.achievements %}
-            <div class="edu-section-title">Achievements</div>
-            {% for ach in edu.achievements %}
-            <div class="edu-achievement">{{ ach }}</div>
-            {% endfor %}
-            {% endif %}
-        </div>
-        {% endfor %}
-        {% if cfg.certifications %}
-        <div class="cert-grid">
-            {% for cert in cfg.certifications %}
-            <a href="{{ cert.link }}" class="cert-card reveal" target="_blank">
-                <div class="cert-icon">🏅</div>
-                <div class="cert-name">{{ cert.name }}</div>
-                <div class="cert-issuer">{{ cert.issuer }}</div>
-                <div class="cert-date">{{ cert.date }}</div>
-            </a>
-            {% endfor %}
-        </div>
-        {% endif %}
-    </section>
-
-    <!-- ═══════ ACHIEVEMENTS ═══════ -->
-    {% if cfg.achievements %}
-    <section id="achievements">
-        <div class="section-header reveal">
-            <span class="section-label">Achievements</span>
-            <h2 class="section-title">Milestones & Recognition</h2>
-        </div>
-        <div class="achieve-grid">
-            {% for ach in cfg.achievements %}
-            <div class="achieve-card reveal">
-                <div class="achieve-icon">{{ ach.icon }}</div>
-                <div class="achieve-title">{{ ach.title }}</div>
-                <div class="achieve-desc">{{ ach.description }}</div>
-            </div>
-            {% endfor %}
-        </div>
-    </section>
-    {% endif %}
-
-    <!-- ═══════ TESTIMONIALS ═══════ -->
-    {% if cfg.testimonials %}
-    <section id="testimonials">
-        <div class="section-header reveal">
-            <span class="section-label">Testimonials</span>
-            <h2 class="section-title">What people say</h2>
-        </div>
-        <div class="testimonials-grid">
-            {% for test in cfg.testimonials %}
-            <div class="testimonial-card reveal">
-                <div class="testimonial-quote">"</div>
-                <div class="testimonial-text">{{ test.text }}</div>
-                <div class="testimonial-author">
-                    <div class="testimonial-avatar">{{ test.name[0] }}</div>
-                    <div>
-                        <div class="testimonial-name">{{ test.name }}</div>
-                        <div class="testimonial-role">{{ test.role }}</div>
-                    </div>
-                </div>
-            </div>
-            {% endfor %}
-        </div>
-    </section>
-    {% endif %}
-
-    <!-- ═══════ CONTACT ═══════ -->
-    <section id="contact">
-        <div class="contact-content reveal">
-            <span class="section-label">Contact</span>
-            <h2>Let's Build Something<br><span class="gradient-text">Amazing Together</span></h2>
-            <p>I'm always open to discussing new projects, creative ideas, or opportunities to be part of your vision.</p>
-            <div class="contact-links">
-                <a href="mailto:{{ cfg.personal.email }}" class="contact-link">
-                    <i class="fas fa-envelope"></i> {{ cfg.personal.email }}
-                </a>
-                {% if cfg.personal.phone %}
-                <a href="tel:{{ cfg.personal.phone }}" class="contact-link">
-                    <i class="fas fa-phone"></i> {{ cfg.personal.phone }}
-                </a>
-                {% endif %}
-                {% if cfg.personal.location %}
-                <div class="contact-link">
-                    <i class="fas fa-map-marker-alt"></i> {{ cfg.personal.location }}
-                </div>
-                {% endif %}
-            </div>
-            <div class="social-links">
-                {% if cfg.social.github %}
-                <a href="{{ cfg.social.github }}" class="social-link" target="_blank" title="GitHub"><i class="fab fa-github"></i></a>
-                {% endif %}
-                {% if cfg.social.linkedin %}
-                <a href="{{ cfg.social.linkedin }}" class="social-link" target="_blank" title="LinkedIn"><i class="fab fa-linkedin-in"></i></a>
-                {% endif %}
-                {% if cfg.social.twitter %}
-                <a href="{{ cfg.social.twitter }}" class="social-link" target="_blank" title="Twitter"><i class="fab fa-twitter"></i></a>
-                {% endif %}
-                {% if cfg.social.leetcode %}
-                <a href="{{ cfg.social.leetcode }}" class="social-link" target="_blank" title="LeetCode"><i class="fas fa-code"></i></a>
-                {% endif %}
-                {% if cfg.social.devto %}
-                <a href="{{ cfg.social.devto }}" class="social-link" target="_blank" title="Dev.to"><i class="fab fa-dev"></i></a>
-                {% endif %}
-                {% if cfg.social.medium %}
-                <a href="{{ cfg.social.medium }}" class="social-link" target="_blank" title="Medium"><i class="fab fa-medium"></i></a>
-                {% endif %}
-                {% if cfg.social.stackoverflow %}
-                <a href="{{ cfg.social.stackoverflow }}" class="social-link" target="_blank" title="StackOverflow"><i class="fab fa-stack-overflow"></i></a>
-                {% endif %}
-            </div>
-        </div>
-    </section>
-
-    <!-- ═══════ FOOTER ═══════ -->
-    <footer>
-        <p>© {{ cfg.footer.copyright }} {{ cfg.personal.name }}. {{ cfg.footer.tagline }}</p>
-    </footer>
-
-    <!-- ═══════ JAVASCRIPT ═══════ -->
-    <script>
-        // ── Cursor follower ──
-        document.addEventListener('mousemove', e => {
-            const glow = document.getElementById('cursorGlow');
-            glow.style.left = e.clientX + 'px';
-            glow.style.top = e.clientY + 'px';
-        });
-
-        // ── Navbar scroll effect ──
-        window.addEventListener('scroll', () => {
-            document.getElementById('navbar').classList.toggle('scrolled', window.scrollY > 50);
-        });
-
-        // ── Mobile menu ──
-        function toggleMenu() {
-            document.getElementById('navLinks').classList.toggle('open');
-            document.getElementById('hamburger').classList.toggle('active');
-        }
-        document.querySelectorAll('.nav-links a').forEach(a => {
-            a.addEventListener('click', () => {
-                document.getElementById('navLinks').classList.remove('open');
-                document.getElementById('hamburger').classList.remove('active');
-            });
-        });
-
-        // ── Active nav link highlight ──
-        const sections = document.querySelectorAll('section[id]');
-        window.addEventListener('scroll', () => {
-            const scrollY = window.scrollY + 100;
-            sections.forEach(sec => {
-                const top = sec.offsetTop, height = sec.offsetHeight, id = sec.getAttribute('id');
-                const link = document.querySelector(`.nav-links a[href="#${id}"]`);
-                if (link) link.classList.toggle('active', scrollY >= top && scrollY < top + height);
-            });
-        });
-
-        // ── Typing animation ──
-        const titles = [
-            "{{ cfg.personal.title }}",
-            {% for sg in cfg.skills %}"{{ sg.category }} Expert",{% endfor %}
-            "Problem Solver"
-        ];
-        let titleIdx = 0, charIdx = 0, deleting = false;
-        const typingEl = document.getElementById('typingText');
-        function typeEffect() {
-            const current = titles[titleIdx];
-            typingEl.textContent = current.substring(0, charIdx);
-            if (!deleting) {
-                charIdx++;
-                if (charIdx > current.length) { deleting = true; setTimeout(typeEffect, 2000); return; }
-            } else {
-                charIdx--;
-                if (charIdx < 0) { deleting = false; titleIdx = (titleIdx + 1) % titles.length; charIdx = 0; }
-            }
-            setTimeout(typeEffect, deleting ? 40 : 80);
-        }
-        typeEffect();
-
-        // ── Scroll reveal ──
-        const observer = new IntersectionObserver((entries) => {
-            entries.forEach(entry => {
-                if (entry.isIntersecting) {
-                    entry.target.classList.add('visible');
-                    // Animate skill bars
-                    entry.target.querySelectorAll('.skill-fill').forEach(bar => {
-                        bar.style.width = bar.dataset.width + '%';
-                    });
-                }
-            });
-        }, { threshold: 0.1, rootMargin: '0px 0px -50px 0px' });
-        document.querySelectorAll('.reveal').forEach(el => observer.observe(el));
-
-        // ── Counter animation ──
-        function animateCounters() {
-            document.querySelectorAll('.stat-number').forEach(counter => {
-                const target = parseInt(counter.dataset.count) || 0;
-                const duration = 2000;
-                const step = target / (duration / 16);
-                let current = 0;
-                const update = () => {
-                    current += step;
-                    if (current < target) {
-                        counter.textContent = Math.ceil(current) + '+';
-                        requestAnimationFrame(update);
-                    } else {
-                        counter.textContent = target + '+';
-                    }
-                };
-                update();
-            });
-        }
-        animateCounters();
-
-        // ── Project filter ──
-        function filterProjects(category) {
-            document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
-            event.target.classList.add('active');
-            document.querySelectorAll('.project-card').forEach(card => {
-                if (category === 'all' || card.dataset.category === category) {
-                    card.style.display = '';
-                    card.style.animation = 'fadeInUp 0.5s ease forwards';
-                } else {
-                    card.style.display = 'none';
-                }
-            });
-        }
-
-        // ── Smooth scroll for all anchor links ──
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
-            anchor.addEventListener('click', function(e) {
-                e.preventDefault();
-                const target = document.querySelector(this.getAttribute('href'));
-                if (target) target.scrollIntoView({ behavior: 'smooth' });
-            });
-        });
-    </script>
-</body>
-</html>
-"""
 
 # ═══════════════════════════════════════════════════════════
 #  RUN SERVER
 # ═══════════════════════════════════════════════════════════
+def warm_up():
+    # Compile the template, load the config snapshot and pre-render (and
+    # pre-compress) the page so forked workers inherit all of it.
+    with app.app_context():
+        page = get_page()
+        for encoding in assets.ENCODINGS:
+            page_variant(page, encoding)
+
+def _reset_after_fork():
+    # Threads do not survive fork(): each worker starts its own watcher
+    global _watcher_started, _snapshot_lock, _template_lock, _static_lru_lock
+    _watcher_started = False
+    _snapshot_lock, _template_lock, _static_lru_lock = threading.Lock(), threading.Lock(), threading.Lock()
+    live_events.cond = threading.Condition()
+    _fragments.lock = threading.Lock()
+    # The parent's warm-up render is not this worker's: start /metrics counts from zero
+    _fragments.hits = _fragments.misses = 0
+    metrics.REGISTRY.lock = threading.Lock()
+    _vitals.lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 if __name__ == "__main__":
-    import sys, io
+    import argparse
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    PORT = 5000
+    parser = argparse.ArgumentParser(description="Portfolio server")
+    parser.add_argument("--prod", action="store_true", help="run the multi-worker production server")
+    parser.add_argument("--host", default=None, help="bind address (default: localhost, 0.0.0.0 with --prod)")
+    parser.add_argument("--port", type=int, default=None, help="port (default: 5000, 8000 with --prod)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--threads", type=int, default=8, help="threads per worker (default: 8)")
+    parser.add_argument("--access-log", action="store_true", help="log every request (production mode)")
+    args = parser.parse_args()
+
+    if args.prod:
+        import server, shutil, tempfile
+        host, port = args.host or "0.0.0.0", args.port or 8000
+        # Workers pool their metrics through files, so any of them can answer /metrics
+        metrics_dir = os.environ.get("PORTFOLIO_METRICS_DIR") or tempfile.mkdtemp(prefix="portfolio-metrics-")
+        metrics.REGISTRY.share(metrics_dir)
+        print("\n" + "=" * 60)
+        print("  >>  PORTFOLIO SERVER RUNNING (production)")
+        print(f"  ->  Listening on http://{host}:{port}")
+        print("  ->  Ctrl+C / SIGTERM drains in-flight requests and exits")
+        print("=" * 60 + "\n")
+        server.serve(app, host, port, workers=args.workers, threads=args.threads,
+                     warm_up=warm_up, access_log=args.access_log,
+                     events=live_events if app.config["LIVE_RELOAD"] else None)
+        if not os.environ.get("PORTFOLIO_METRICS_DIR"):
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+        sys.exit(0)
+
+    PORT = args.port or 5000
     print("\n" + "=" * 60)
     print("  >>  PORTFOLIO SERVER RUNNING")
     print(f"  ->  Open: http://localhost:{PORT}")
-    print("  ->  Edit config.json & refresh to update content")
+    print("  ->  Edit config.json: open pages update live")
     print("  ->  Press Ctrl+C to stop")
     print("=" * 60 + "\n")
 
     # Auto-open browser
     threading.Timer(1.5, lambda: webbrowser.open(f"http://localhost:{PORT}")).start()
-    app.run(debug=True, port=PORT, use_reloader=True)
+    app.run(host=args.host, debug=True, port=PORT, use_reloader=True, extra_files=[page_template.PATH])
@@ -0,0 +1,136 @@
+"""
+On-demand profiling for portfolio.py and build.py.
+
+Profile() wraps a block of work and, when it ends, writes to PROFILE_DIR:
+
+  <name>.pstats      cProfile data; python -m pstats, snakeviz, ...
+  <name>.collapsed   stacks sampled every SAMPLE_INTERVAL, one
+                     "outer;...;inner count" line per stack, the input of
+                     flamegraph.pl and speedscope
+  <name>.alloc.txt   tracemalloc: peak and the lines that allocated most
+  <name>.tracemalloc the full allocation snapshot (tracemalloc.Snapshot.load)
+
+The Flask app installs ProfilerMiddleware only when PORTFOLIO_PROFILE=1, so
+?__profile=1 costs nothing when profiling is off; build.py --profile wraps the
+whole build.
+"""
+import cProfile, os, re, sys, threading, time, tracemalloc
+from collections import Counter
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.environ.get("PORTFOLIO_PROFILE_DIR") or os.path.join(BASE_DIR, "profiles")
+SAMPLE_INTERVAL = 0.001  # seconds
+TRACEMALLOC_FRAMES = 16
+TOP_ALLOCATIONS = 40
+QUERY_FLAG = "__profile=1"
+
+_lock = threading.Lock()  # cProfile and tracemalloc are process-wide: one profile at a time
+
+def _frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class _Sampler(threading.Thread):
+    """Records the stack of one thread every SAMPLE_INTERVAL."""
+
+    def __init__(self, thread_id):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.stacks = Counter()
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+class Profile:
+    """with Profile("build") as p: ... then p.paths lists the files written."""
+
+    def __init__(self, name, directory=None):
+        stamp = time.strftime("%Y%m%d-%H%M%S") + f"-{int(time.time() * 1000) % 1000:03d}"
+        self.name = f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_') or 'profile'}-{stamp}"
+        self.directory = directory or PROFILE_DIR
+        self.paths = []
+
+    def __enter__(self):
+        _lock.acquire()
+        self.profiler = cProfile.Profile()
+        self.sampler = _Sampler(threading.get_ident())
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.t0 = time.perf_counter()
+        self.sampler.start()
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self.profiler.disable()
+            self.elapsed = time.perf_counter() - self.t0
+            self.sampler.done.set()
+            self.sampler.join()
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self._write(snapshot, peak)
+        finally:
+            _lock.release()
+
+    def _write(self, snapshot, peak):
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, self.name)
+        self.profiler.dump_stats(base + ".pstats")
+        with open(base + ".collapsed", "w", encoding="utf-8") as f:
+            for stack, count in self.sampler.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        # Allocations by the profiling itself would swamp the report
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                           tracemalloc.Filter(False, __file__)])
+        snapshot.dump(base + ".tracemalloc")
+        stats = snapshot.statistics("lineno")
+        with open(base + ".alloc.txt", "w", encoding="utf-8") as f:
+            f.write(f"{self.name}: {self.elapsed * 1000:.1f} ms, peak traced memory {peak / 1024:,.1f} KiB, "
+                    f"{sum(s.size for s in stats) / 1024:,.1f} KiB still allocated at the end\n\n")
+            for stat in stats[:TOP_ALLOCATIONS]:
+                f.write(f"{stat}\n")
+        self.paths = [base + ext for ext in (".pstats", ".collapsed", ".alloc.txt", ".tracemalloc")]
+
+class ProfilerMiddleware:
+    """WSGI middleware: a request whose query string has __profile=1 is
+    profiled from dispatch to its last body byte (streamed pages included)
+    and answered with an X-Profile header naming the files."""
+
+    def __init__(self, app, directory=None):
+        self.app = app
+        self.directory = directory
+
+    def __call__(self, environ, start_response):
+        if QUERY_FLAG not in environ.get("QUERY_STRING", "").split("&"):
+            return self.app(environ, start_response)
+        profile = Profile(f"{environ['REQUEST_METHOD']}{environ.get('PATH_INFO', '/')}", self.directory)
+        response = []
+
+        def capture(status, headers, exc_info=None):
+            response[:] = [status, list(headers), exc_info]
+            return lambda data: body.append(data)
+
+        body = []
+        with profile:
+            result = self.app(environ, capture)
+            stream = dict((k.lower(), v) for k, v in response[1]).get("content-type", "").startswith("text/event-stream")
+            if not stream:  # an event stream never ends: profile only up to its headers
+                try:
+                    body.extend(result)
+                finally:
+                    if hasattr(result, "close"):
+                        result.close()
+        status, headers, exc_info = response
+        headers.append(("X-Profile", profile.name))
+        print(f"[profile] {environ['REQUEST_METHOD']} {environ.get('PATH_INFO', '/')}: "
+              f"{profile.elapsed * 1000:.1f} ms -> {os.path.join(profile.directory, profile.name)}.*")
+        start_response(status, headers, exc_info)
+        return result if stream else body
@@ -0,0 +1,78 @@
+"""
+Paginated project listing shared by portfolio.py (/api/projects) and
+build.py (static docs/api/projects/ pages).
+
+The page renders only the first PAGE_SIZE project cards; the filter buttons
+and "Load more" fetch further pages as JSON. build_index() groups project
+positions by category once per config, so a page is a slice of a
+precomputed list instead of a scan over every project.
+"""
+import math, re
+
+PAGE_SIZE = 12
+MAX_PAGE_SIZE = 48
+ALL = "all"
+FEATURED = "featured"
+IMAGE_SIZES = "(max-width: 900px) 100vw, 400px"  # sizes="" of a card image
+
+def slugify(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "category"
+
+def build_index(projects, featured=()):
+    """Index of config_model.Project entries (featured: the featured ones):
+       {"categories": [{"name", "slug", "total"}, ...] in first-seen order,
+        "members": {slug: [project positions]} with "all" covering every project
+                   and "featured" the featured ones,
+        "slugs": {category name: slug}}"""
+    members, categories = {ALL: [p.position for p in projects], FEATURED: [p.position for p in featured]}, []
+    slugs = {}  # category name -> slug, unique even if two names slugify alike
+    for proj in projects:
+        name = proj.category
+        slug = slugs.get(name)
+        if slug is None:
+            slug = base = slugify(name)
+            n = 1
+            while slug in members:
+                n += 1
+                slug = f"{base}-{n}"
+            slugs[name] = slug
+            members[slug] = []
+            categories.append({"name": name, "slug": slug})
+        members[slug].append(proj.position)
+    for cat in categories:
+        cat["total"] = len(members[cat["slug"]])
+    return {"categories": categories, "members": members, "slugs": slugs}
+
+def resolve_category(index, category):
+    """Slug for a category given by name or slug ("" / "all" = every project,
+    "featured" = the featured ones); None if there is no such category."""
+    if not category or category == ALL:
+        return ALL
+    if category in index["slugs"]:
+        return index["slugs"][category]
+    return category if category in index["members"] else None
+
+def page_count(total, size):
+    return max(1, math.ceil(total / size))
+
+def project_page(projects, index, slug, page, size=PAGE_SIZE, picture=None):
+    """One page of a category as a JSON-ready dict; page counts from 1.
+    picture(proj) returns the card image markup for projects with an image."""
+    members = index["members"][slug]
+    start = (page - 1) * size
+    items = []
+    for i in members[start:start + size]:
+        item = dict(projects[i])
+        if picture and item.get("image"):
+            item["picture"] = str(picture(item))
+        items.append(item)
+    pages = page_count(len(members), size)
+    return {"category": slug, "page": page, "size": size, "total": len(members), "pages": pages,
+            "next": page + 1 if page < pages else None, "items": items}
+
+def static_pages(projects, index, picture=None):
+    """(path, page dict) for every page of every category, as published by
+    build.py: api/projects/<slug>/<page>.json with PAGE_SIZE items each."""
+    for slug, members in index["members"].items():
+        for page in range(1, page_count(len(members), PAGE_SIZE) + 1):
+            yield f"api/projects/{slug}/{page}.json", project_page(projects, index, slug, page, PAGE_SIZE, picture)
@@ -0,0 +1,420 @@
+"""
+Production server for portfolio.py — a small pre-forking WSGI server.
+
+The parent binds the listening socket and warms the app up (compiled
+template, config snapshot, rendered page) before forking, so every worker
+starts with all of it already in memory (shared copy-on-write). Each worker
+serves requests from a fixed-size thread pool; connections waiting for a
+request (new ones, keep-alive ones between requests) wait in one selector
+thread instead, so idle browsers cannot tie up the pool. SIGTERM / SIGINT stop
+accepting new connections, let in-flight requests finish, then exit.
+
+Server-Sent Events connections (the app's live reload) are answered by the
+request handler itself and then handed to an EventHub: one selector thread
+per worker holds every idle event stream, so hundreds of open browser tabs
+do not tie up the thread pool.
+
+Usage:  python portfolio.py --prod [--host 0.0.0.0] [--port 8000]
+                                   [--workers N] [--threads N]
+"""
+import os, queue, selectors, signal, socket, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+KEEPALIVE_TIMEOUT = 5  # seconds a connection may wait for a request, or stall in the middle of one
+SHUTDOWN_GRACE = 30    # seconds workers get to drain before they are killed
+EVENT_BACKLOG = 64 * 1024  # bytes an event stream may fall behind before it is dropped
+
+
+class EventHub:
+    """Holds Server-Sent Events connections in one selector thread.
+
+    source is the app's event feed: .path, .hello() (bytes sent first on each
+    connection), .heartbeat (seconds) and .subscribe(listener), where
+    listener(message) is called with every event. Only the hub thread touches
+    the sockets; other threads talk to it through a queue plus a wake-up pipe.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.path = source.path
+        self.selector = selectors.DefaultSelector()
+        self.clients = {}  # socket -> bytearray of unsent data
+        self.inbox = queue.SimpleQueue()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self.selector.register(self._wake_r, selectors.EVENT_READ)
+        source.subscribe(lambda message: self._post("send", message))
+        self.thread = threading.Thread(target=self._run, name="event-hub", daemon=True)
+        self.thread.start()
+
+    def attach(self, sock):
+        self._post("attach", sock)
+
+    def stop(self):
+        self._post("stop", None)
+        self.thread.join(timeout=5)
+
+    def _post(self, kind, item):
+        self.inbox.put((kind, item))
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass  # pipe full: the hub is awake anyway
+
+    def _run(self):
+        last_write = time.monotonic()
+        while True:
+            for key, mask in self.selector.select(timeout=self.source.heartbeat):
+                sock = key.fileobj
+                if sock is self._wake_r:
+                    try:
+                        while sock.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                if mask & selectors.EVENT_READ:
+                    # Clients never send anything after the request: readable means closed
+                    try:
+                        data = sock.recv(4096)
+                    except BlockingIOError:
+                        data = None
+                    except OSError:
+                        data = b""
+                    if data == b"":
+                        self._drop(sock)
+                        continue
+                if mask & selectors.EVENT_WRITE:
+                    self._flush(sock)
+            while True:
+                try:
+                    kind, item = self.inbox.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "attach":
+                    item.setblocking(False)
+                    self.clients[item] = bytearray()
+                    self.selector.register(item, selectors.EVENT_READ)
+                elif kind == "send":
+                    for sock in list(self.clients):
+                        self._write(sock, item)
+                    last_write = time.monotonic()
+                else:  # stop: browsers reconnect to another worker
+                    for sock in list(self.clients):
+                        self._drop(sock)
+                    return
+            if time.monotonic() - last_write >= self.source.heartbeat:
+                for sock in list(self.clients):
+                    self._write(sock, b": ping\n\n")
+                last_write = time.monotonic()
+
+    def _write(self, sock, data):
+        self.clients[sock] += data
+        self._flush(sock)
+
+    def _flush(self, sock):
+        pending = self.clients.get(sock)
+        if pending is None:
+            return
+        try:
+            del pending[:sock.send(pending)]
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._drop(sock)
+            return
+        if len(pending) > EVENT_BACKLOG:
+            self._drop(sock)
+            return
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if pending else 0)
+        if self.selector.get_key(sock).events != events:
+            self.selector.modify(sock, events)
+
+    def _drop(self, sock):
+        self.clients.pop(sock, None)
+        try:
+            self.selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+        sock.close()
+
+
+class IdleConnections:
+    """Connections waiting for their next request, in one selector thread.
+
+    ready(handler) is called once a connection is readable, expire(handler)
+    when it stayed idle for timeout seconds or the server is stopping. Like
+    EventHub, only this thread touches the selector.
+    """
+
+    def __init__(self, ready, expire, timeout=KEEPALIVE_TIMEOUT):
+        self.ready, self.expire, self.timeout = ready, expire, timeout
+        self.selector = selectors.DefaultSelector()
+        self.waiting = {}  # socket -> (handler, deadline)
+        self.inbox = queue.SimpleQueue()
+        self.lock = threading.Lock()
+        self.closed = False
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self.selector.register(self._wake_r, selectors.EVENT_READ)
+        self.thread = threading.Thread(target=self._run, name="idle-connections", daemon=True)
+        self.thread.start()
+
+    def park(self, handler):
+        with self.lock:
+            if not self.closed:
+                self._post(handler)
+                return
+        self.expire(handler)
+
+    def stop(self):
+        with self.lock:
+            self.closed = True
+            self._post(None)
+        self.thread.join(timeout=5)
+
+    def _post(self, item):
+        self.inbox.put(item)
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass  # pipe full: the thread is awake anyway
+
+    def _run(self):
+        while True:
+            now = time.monotonic()
+            wake = min((deadline for _, deadline in self.waiting.values()), default=now + self.timeout)
+            for key, _ in self.selector.select(timeout=max(0, wake - now)):
+                sock = key.fileobj
+                if sock is self._wake_r:
+                    try:
+                        while sock.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                handler, _ = self.waiting.pop(sock)
+                self.selector.unregister(sock)
+                self.ready(handler)
+            while True:
+                try:
+                    handler = self.inbox.get_nowait()
+                except queue.Empty:
+                    break
+                if handler is None:  # stop
+                    for sock in list(self.waiting):
+                        self._expire(sock)
+                    return
+                self.waiting[handler.connection] = (handler, time.monotonic() + self.timeout)
+                self.selector.register(handler.connection, selectors.EVENT_READ)
+            now = time.monotonic()
+            for sock, (handler, deadline) in list(self.waiting.items()):
+                if deadline <= now:
+                    self._expire(sock)
+
+    def _expire(self, sock):
+        handler, _ = self.waiting.pop(sock)
+        self.selector.unregister(sock)
+        self.expire(handler)
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT
+
+    def __init__(self, request, client_address, server):
+        # setup() only: PooledWSGIServer calls serve_one() whenever the
+        # connection has a request waiting, and finish() when it is done
+        self.request, self.client_address, self.server = request, client_address, server
+        self.setup()
+
+    def serve_one(self):
+        """Handle one request; True if the connection stays open for another."""
+        self.close_connection = True
+        try:
+            self.handle_one_request()
+        except (ConnectionError, socket.timeout) as e:
+            self.connection_dropped(e)
+        return not self.close_connection
+
+    def pending(self):
+        """True if the next request is already buffered or readable (pipelining)."""
+        self.connection.setblocking(False)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def log_request(self, code="-", size="-"):
+        if self.server.access_log:
+            super().log_request(code, size)
+
+    def run_wsgi(self):
+        hub = self.server.event_hub
+        if hub is not None and self.command == "GET" and self.path.split("?", 1)[0] == hub.path:
+            self.open_event_stream(hub)
+        else:
+            super().run_wsgi()
+
+    def open_event_stream(self, hub):
+        self.wfile.write(b"HTTP/1.1 200 OK\r\n"
+                         b"Content-Type: text/event-stream\r\n"
+                         b"Cache-Control: no-cache\r\n"
+                         b"X-Accel-Buffering: no\r\n"
+                         b"\r\n" + hub.source.hello())
+        self.wfile.flush()
+        self.log_request(200)
+        self.close_connection = True
+        # From here on the socket belongs to the hub, not to this handler
+        self.server.detached.add(self.connection)
+        hub.attach(self.connection)
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    multithread = True
+    multiprocess = True
+    access_log = False
+    event_hub = None
+
+    def __init__(self, host, port, app, threads, fd=None):
+        super().__init__(host, port, app, handler=QuietRequestHandler, fd=fd)
+        self.pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="http")
+        self.idle = IdleConnections(lambda handler: self.pool.submit(self._serve, handler), self._close)
+        self.detached = set()  # connections handed over to the event hub
+
+    def get_request(self):
+        conn, addr = super().get_request()
+        if conn.family in (socket.AF_INET, socket.AF_INET6):
+            # Headers and body (or streamed chunks) go out as separate writes;
+            # without this, Nagle + delayed ACK stall each one by tens of ms
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return conn, addr
+
+    def process_request(self, request, client_address):
+        # The pool gets the connection once its request has arrived
+        self.idle.park(self.RequestHandlerClass(request, client_address, self))
+
+    def _serve(self, handler):
+        try:
+            while handler.serve_one():
+                if not handler.pending():
+                    self.idle.park(handler)  # keep-alive: wait for the next request off the pool
+                    return
+        except Exception:
+            self.handle_error(handler.request, handler.client_address)
+        self._close(handler)
+
+    def _close(self, handler):
+        handler.finish()
+        if handler.request in self.detached:
+            self.detached.discard(handler.request)
+        else:
+            self.shutdown_request(handler.request)
+
+
+def _run_worker(app, sock, host, port, threads, access_log, events=None):
+    server = PooledWSGIServer(host, port, app, threads, fd=sock.fileno())
+    server.access_log = access_log
+    if events is not None:
+        server.event_hub = EventHub(events)
+
+    def stop(signum, frame):
+        # shutdown() blocks until serve_forever() returns, so call it off-thread
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    server.serve_forever(poll_interval=0.5)
+    server.server_close()
+    if server.event_hub is not None:
+        server.event_hub.stop()
+    server.idle.stop()  # idle keep-alive connections are closed, not drained
+    server.pool.shutdown(wait=True)  # let in-flight requests finish
+
+
+def _fork_worker(app, sock, host, port, threads, access_log, events=None):
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _run_worker(app, sock, host, port, threads, access_log, events)
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def serve(app, host="127.0.0.1", port=8000, workers=None, threads=8,
+          warm_up=None, access_log=False, events=None):
+    workers = workers or os.cpu_count() or 1
+    sock = socket.create_server((host, port), backlog=2048,
+                                family=socket.AF_INET6 if ":" in host else socket.AF_INET)
+    # Non-blocking so a worker that loses the accept() race goes back to select()
+    sock.setblocking(False)
+    if warm_up is not None:
+        warm_up()
+
+    if workers <= 1 or not hasattr(os, "fork"):
+        print(f"  ->  1 worker x {threads} threads (pid {os.getpid()})")
+        _run_worker(app, sock, host, port, threads, access_log, events)
+        sock.close()
+        return
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    children = set()
+    for _ in range(workers):
+        children.add(_fork_worker(app, sock, host, port, threads, access_log, events))
+    print(f"  ->  {workers} workers x {threads} threads (master pid {os.getpid()})")
+
+    while not stopping:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid == 0:
+            time.sleep(0.2)
+            continue
+        children.discard(pid)
+        if not stopping:
+            print(f"  !!  worker {pid} exited ({status}), respawning", file=sys.stderr)
+            time.sleep(1)
+            children.add(_fork_worker(app, sock, host, port, threads, access_log, events))
+
+    # Graceful shutdown: ask workers to drain, then force whatever is left
+    for pid in children:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    deadline = time.monotonic() + SHUTDOWN_GRACE
+    while children and time.monotonic() < deadline:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid == 0:
+            time.sleep(0.1)
+        else:
+            children.discard(pid)
+    for pid in children:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    sock.close()
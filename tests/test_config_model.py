@@ -0,0 +1,35 @@
+"""config_model.validate() rejects configs the template cannot render."""
+import json, os
+import pytest
+import config_model
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json")
+
+@pytest.fixture
+def cfg():
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def test_shipped_config_is_valid(cfg):
+    assert config_model.validate(cfg) == []
+
+def test_personal_name_is_required(cfg):
+    del cfg["personal"]["name"]
+    assert config_model.validate(cfg) == ["personal.name is missing"]
+
+@pytest.mark.parametrize("name, kind", [("", "an empty string"), ("   ", "an empty string"), (None, "null"), (42, "42")])
+def test_personal_name_must_be_a_non_empty_string(cfg, name, kind):
+    cfg["personal"]["name"] = name
+    assert config_model.validate(cfg) == [f"personal.name must be a non-empty string, not {kind}"]
+
+def test_testimonial_name_is_required(cfg):
+    cfg["testimonials"] = [{"role": "CTO", "text": "Great."}, {"name": "", "text": "Also great."}]
+    assert config_model.validate(cfg) == ["testimonials[0].name is missing",
+                                          "testimonials[1].name must be a non-empty string, not an empty string"]
+
+def test_load_raises_every_error(cfg):
+    del cfg["personal"]["name"]
+    cfg["testimonials"] = [{}]
+    with pytest.raises(config_model.ConfigError) as e:
+        config_model.load(cfg)
+    assert e.value.errors == ["personal.name is missing", "testimonials[0].name is missing"]
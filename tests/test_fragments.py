@@ -0,0 +1,25 @@
+"""fragments.block_dependencies() finds the config keys each block reads."""
+import pytest
+from jinja2 import Environment
+import fragments
+
+def deps(body):
+    source = "{% block section %}" + body + "{% endblock %}"
+    return fragments.block_dependencies(Environment(), source, str(hash(source)))["section"]
+
+def test_attribute_and_item_access_are_keys():
+    keys, names = deps("{{ cfg.personal.name }} {{ cfg['projects']|length }} {{ total_tech }}")
+    assert keys == {"personal", "projects"}
+    assert names == {"total_tech"}
+
+@pytest.mark.parametrize("body", [
+    '{{ cfg.get("personal").name }}',
+    "{% for k, v in cfg.items() %}{{ k }}{% endfor %}",
+    "{{ cfg.keys()|list }}",
+    "{{ cfg[section] }}",
+    "{{ cfg|tojson }}",
+])
+def test_whole_config_uses_depend_on_every_key(body):
+    keys, _ = deps(body)
+    assert fragments.ALL_KEYS in keys
+    assert not keys & {"get", "items", "keys"}
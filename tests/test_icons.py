@@ -0,0 +1,22 @@
+"""icons.subset_icons() inlines every Font Awesome icon or fails the build."""
+import pytest
+import icons
+
+PAGE = ('<head><link rel="stylesheet" href="https://cdnjs.cloudflare.com/font-awesome/all.min.css">\n</head>'
+        '<body>{}</body>')
+
+@pytest.mark.parametrize("icon", ['<i class="fas fa-rocket"></i>', "<i class='fas fa-rocket'></i>"])
+def test_both_quote_styles_are_inlined(icon):
+    html, used = icons.subset_icons(PAGE.format(icon))
+    assert used == {"fa-solid-rocket": ("solid", "rocket")}
+    assert '<use href="#fa-solid-rocket">' in html
+    assert "font-awesome" not in html
+
+@pytest.mark.parametrize("icon", ['<i class="fas fa-rocket">Go</i>', "<i class=fa-rocket></i>"])
+def test_icons_that_cannot_be_inlined_fail(icon):
+    with pytest.raises(ValueError, match="not inlined"):
+        icons.subset_icons(PAGE.format(icon))
+
+def test_unknown_icons_fail():
+    with pytest.raises(ValueError, match="missing icons"):
+        icons.subset_icons(PAGE.format('<i class="fas fa-no-such-icon"></i>'))
@@ -0,0 +1,175 @@
+"""
+Real-user Web Vitals for portfolio.py.
+
+The page measures LCP, CLS, INP and TTFB in the visitor's browser and sends
+them with navigator.sendBeacon() to POST /api/vitals when the page is first
+hidden. The endpoint queues the samples in memory; a writer thread stores
+them in batches in a local SQLite file, which keeps only the newest
+MAX_SAMPLES (a ring buffer), so it never grows without bound.
+
+Usage:  python vitals.py [report] [--since 7d] [--db PATH] [--json]
+
+The report shows p50 / p75 / p95 per metric and page variant ("default" is
+the Flask app and the plain build, other names are build.py variants), with
+each p75 rated against the usual good / poor thresholds.
+"""
+import argparse, atexit, json, math, os, sqlite3, sys, io, threading, time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.environ.get("PORTFOLIO_VITALS_DB") or os.path.join(BASE_DIR, "vitals.sqlite3")
+# metric -> (good up to, poor from, largest value accepted); CLS is unitless, the rest ms
+METRICS = {"LCP": (2500, 4000, 120000), "CLS": (0.1, 0.25, 100), "INP": (200, 500, 120000),
+           "TTFB": (800, 1800, 120000)}
+MAX_SAMPLES = 50_000
+MAX_BEACON_BYTES = 4096
+BATCH_SIZE = 200       # samples that trigger a write before FLUSH_INTERVAL is up
+FLUSH_INTERVAL = 2.0   # seconds
+DEFAULT_VARIANT = "default"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    variant TEXT NOT NULL,
+    page TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_ts ON samples (ts);
+"""
+
+def connect(path):
+    db = sqlite3.connect(path, timeout=10)
+    db.execute("PRAGMA journal_mode=WAL")  # worker processes write while a report reads
+    db.executescript(SCHEMA)
+    return db
+
+def parse_beacon(data, now):
+    """Rows (ts, metric, value, variant, page) from a beacon body:
+    {"variant": "default", "page": "/", "metrics": {"LCP": 1234.5, ...}}.
+    Raises ValueError for anything malformed."""
+    if len(data) > MAX_BEACON_BYTES:
+        raise ValueError("beacon too large")
+    try:
+        beacon = json.loads(data)
+    except RecursionError:  # deeply nested arrays / objects
+        raise ValueError("beacon nested too deeply") from None
+    if not isinstance(beacon, dict) or not isinstance(beacon.get("metrics"), dict):
+        raise ValueError("expected an object with a 'metrics' object")
+    variant = str(beacon.get("variant") or DEFAULT_VARIANT)[:32]
+    page = str(beacon.get("page") or "/")[:200]
+    rows = []
+    for metric, value in beacon["metrics"].items():
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric {metric!r}")
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 <= value <= METRICS[metric][2]:
+            raise ValueError(f"{metric} out of range")
+        rows.append((now, metric, float(value), variant, page))
+    return rows
+
+class SampleWriter:
+    """Queues samples and writes them to the SQLite ring buffer in batches
+    from a background thread (one per process, started on first use)."""
+
+    def __init__(self, path, max_samples=MAX_SAMPLES):
+        self.path = path
+        self.max_samples = max_samples
+        self.pending = []
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self._thread_pid = None
+
+    def add(self, rows):
+        with self.lock:
+            self.pending += rows
+            full = len(self.pending) >= BATCH_SIZE
+        if self._thread_pid != os.getpid():
+            self._thread_pid = os.getpid()
+            threading.Thread(target=self._run, name="vitals-writer", daemon=True).start()
+            atexit.register(self.flush)
+        if full:
+            self.wake.set()
+
+    def _run(self):
+        while True:
+            self.wake.wait(FLUSH_INTERVAL)
+            self.wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            rows, self.pending = self.pending, []
+        if not rows:
+            return
+        try:
+            db = connect(self.path)
+            try:
+                with db:  # one transaction: insert the batch, then drop what fell off the ring
+                    db.executemany("INSERT INTO samples (ts, metric, value, variant, page) VALUES (?, ?, ?, ?, ?)", rows)
+                    db.execute("DELETE FROM samples WHERE id <= (SELECT MAX(id) FROM samples) - ?", (self.max_samples,))
+            finally:
+                db.close()
+        except sqlite3.Error as e:
+            print(f"[vitals] dropped {len(rows)} sample(s): {e}", file=sys.stderr)
+
+# ─── Report ─────────────────────────────────────────────────
+def percentile(values, q):
+    # Nearest rank on a sorted list
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+def rating(metric, value):
+    good, poor, _ = METRICS[metric]
+    return "good" if value <= good else "poor" if value > poor else "needs improvement"
+
+def parse_since(text):
+    # "7d", "12h", "30m" -> seconds
+    units = {"d": 86400, "h": 3600, "m": 60}
+    if not text or text[-1] not in units or not text[:-1].isdigit():
+        raise argparse.ArgumentTypeError("use a number followed by d, h or m, e.g. 7d")
+    return int(text[:-1]) * units[text[-1]]
+
+def summarize(path, since=None):
+    """{(metric, variant): {"n", "p50", "p75", "p95", "rating"}} over the stored samples."""
+    if not os.path.exists(path):
+        return {}
+    db = connect(path)
+    try:
+        query, args = "SELECT metric, variant, value FROM samples", ()
+        if since:
+            query, args = query + " WHERE ts >= ?", (time.time() - since,)
+        groups = {}
+        for metric, variant, value in db.execute(query, args):
+            groups.setdefault((metric, variant), []).append(value)
+    finally:
+        db.close()
+    summary = {}
+    for key, values in sorted(groups.items(), key=lambda kv: (list(METRICS).index(kv[0][0]), kv[0][1])):
+        values.sort()
+        p75 = percentile(values, 0.75)
+        summary[key] = {"n": len(values), "p50": percentile(values, 0.50), "p75": p75,
+                        "p95": percentile(values, 0.95), "rating": rating(key[0], p75)}
+    return summary
+
+def report(path, since=None, as_json=False):
+    summary = summarize(path, since)
+    if as_json:
+        print(json.dumps([dict(metric=m, variant=v, **s) for (m, v), s in summary.items()], indent=2))
+        return
+    if not summary:
+        print(f"No samples in {path}" + (" for that period" if since else ""))
+        return
+    fmt = lambda metric, v: f"{v:.3f}" if metric == "CLS" else f"{v:,.0f} ms"
+    print(f"{'metric':<6} {'variant':<12} {'samples':>8} {'p50':>10} {'p75':>10} {'p95':>10}  p75 rating")
+    for (metric, variant), s in summary.items():
+        print(f"{metric:<6} {variant:<12} {s['n']:>8,} {fmt(metric, s['p50']):>10} {fmt(metric, s['p75']):>10} "
+              f"{fmt(metric, s['p95']):>10}  {s['rating']}")
+
+if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+    parser = argparse.ArgumentParser(description="Report the Web Vitals collected by /api/vitals")
+    parser.add_argument("command", nargs="?", default="report", choices=["report"])
+    parser.add_argument("--db", default=DB_PATH, help=f"samples database (default: {os.path.relpath(DB_PATH)})")
+    parser.add_argument("--since", type=parse_since, help="only samples from the last period, e.g. 7d, 12h")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args()
+    report(args.db, args.since, args.json)